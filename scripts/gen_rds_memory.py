@@ -0,0 +1,59 @@
+"""
+Generate src/aws/_rds_memory_table.py from the AWS Pricing API.
+
+RDS instance class -> memory is effectively static, so it is looked up once here
+instead of at runtime. Usage: python scripts/gen_rds_memory.py [location]
+"""
+
+import json
+import os
+import sys
+import boto3
+
+DEFAULT_LOCATION = 'Asia Pacific (Singapore)'
+OUTPUT = os.path.join(os.path.dirname(__file__), '..', 'src', 'aws', '_rds_memory_table.py')
+
+HEADER = '''"""
+RDS instance class -> memory (GB).
+Generated by scripts/gen_rds_memory.py; re-run it to refresh instead of editing by hand.
+"""
+
+INSTANCE_MEMORY_GB = {
+'''
+
+def fetch_memory_table(location):
+    """Return instance class -> memory in GB for every RDS instance class priced in location"""
+    # Pricing API is only available in us-east-1
+    pricing = boto3.client('pricing', region_name='us-east-1')
+    paginator = pricing.get_paginator('get_products')
+    pages = paginator.paginate(
+        ServiceCode='AmazonRDS',
+        Filters=[
+            {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': location},
+            {'Type': 'TERM_MATCH', 'Field': 'productFamily', 'Value': 'Database Instance'}
+        ]
+    )
+
+    table = {}
+    for page in pages:
+        for price in page['PriceList']:
+            attributes = json.loads(price)['product']['attributes']
+            instance_class = attributes.get('instanceType')
+            memory = attributes.get('memory')
+            if instance_class and memory:
+                # Memory comes in format like "2 GiB"
+                table[instance_class] = float(memory.split()[0].replace(',', ''))
+    return table
+
+def main():
+    location = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOCATION
+    table = fetch_memory_table(location)
+    with open(OUTPUT, 'w') as f:
+        f.write(HEADER)
+        for instance_class in sorted(table):
+            f.write(f"    '{instance_class}': {table[instance_class]},\n")
+        f.write('}\n')
+    print(f"Wrote {len(table)} instance classes to {os.path.normpath(OUTPUT)}")
+
+if __name__ == '__main__':
+    main()
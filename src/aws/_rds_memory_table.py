@@ -0,0 +1,62 @@
+"""
+RDS instance class -> memory (GB).
+Hand-seeded subset (t3/t4g/m5/m6g/m6i/r5/r6g/r6i), not a complete list; classes missing here fall
+back to the Pricing API at runtime. Run scripts/gen_rds_memory.py to replace it with the full table.
+"""
+
+INSTANCE_MEMORY_GB = {
+    'db.m5.12xlarge': 192.0,
+    'db.m5.16xlarge': 256.0,
+    'db.m5.2xlarge': 32.0,
+    'db.m5.4xlarge': 64.0,
+    'db.m5.8xlarge': 128.0,
+    'db.m5.large': 8.0,
+    'db.m5.xlarge': 16.0,
+    'db.m6g.12xlarge': 192.0,
+    'db.m6g.16xlarge': 256.0,
+    'db.m6g.2xlarge': 32.0,
+    'db.m6g.4xlarge': 64.0,
+    'db.m6g.8xlarge': 128.0,
+    'db.m6g.large': 8.0,
+    'db.m6g.xlarge': 16.0,
+    'db.m6i.12xlarge': 192.0,
+    'db.m6i.16xlarge': 256.0,
+    'db.m6i.2xlarge': 32.0,
+    'db.m6i.4xlarge': 64.0,
+    'db.m6i.8xlarge': 128.0,
+    'db.m6i.large': 8.0,
+    'db.m6i.xlarge': 16.0,
+    'db.r5.12xlarge': 384.0,
+    'db.r5.16xlarge': 512.0,
+    'db.r5.2xlarge': 64.0,
+    'db.r5.4xlarge': 128.0,
+    'db.r5.8xlarge': 256.0,
+    'db.r5.large': 16.0,
+    'db.r5.xlarge': 32.0,
+    'db.r6g.12xlarge': 384.0,
+    'db.r6g.16xlarge': 512.0,
+    'db.r6g.2xlarge': 64.0,
+    'db.r6g.4xlarge': 128.0,
+    'db.r6g.8xlarge': 256.0,
+    'db.r6g.large': 16.0,
+    'db.r6g.xlarge': 32.0,
+    'db.r6i.12xlarge': 384.0,
+    'db.r6i.16xlarge': 512.0,
+    'db.r6i.2xlarge': 64.0,
+    'db.r6i.4xlarge': 128.0,
+    'db.r6i.8xlarge': 256.0,
+    'db.r6i.large': 16.0,
+    'db.r6i.xlarge': 32.0,
+    'db.t3.2xlarge': 32.0,
+    'db.t3.large': 8.0,
+    'db.t3.medium': 4.0,
+    'db.t3.micro': 1.0,
+    'db.t3.small': 2.0,
+    'db.t3.xlarge': 16.0,
+    'db.t4g.2xlarge': 32.0,
+    'db.t4g.large': 8.0,
+    'db.t4g.medium': 4.0,
+    'db.t4g.micro': 1.0,
+    'db.t4g.small': 2.0,
+    'db.t4g.xlarge': 16.0,
+}
@@ -1,29 +1,104 @@
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
 from ..config import (
     AWS_ACCESS_KEY_ID, 
     AWS_SECRET_ACCESS_KEY, 
     AWS_REGION,
-    EC2_CONTROL_LEVELS
+    EC2_CONTROL_LEVELS,
+    EC2_DESCRIBE_BATCH_WINDOW_MS
 )
 from ..utils.logger import get_logger
+from ..utils.helpers import RequestBatcher, TTLCache
 import datetime
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import logging
+import time
+import heapq
+import re
+import pytz
 import os
 import asyncio
 
 logger = get_logger(__name__)
 
+# Shared by every client: room for concurrent gather() fan-out and adaptive retries on throttling
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+# DescribeInstances accepts at most this many IDs per request
+_DESCRIBE_BATCH_SIZE = 100
+
+# How long instance existence and state lookups are reused (seconds)
+_EXISTS_CACHE_TTL = 300
+_STATE_CACHE_TTL = 5
+# Month-to-date billing is reused for this long (seconds); Cost Explorer calls are metered
+_BILLING_CACHE_TTL = 900
+
+# Built-in boto3 waiters for the states wait_for_state is usually asked for
+_STATE_WAITERS = {
+    'running': 'instance_running',
+    'stopped': 'instance_stopped',
+    'terminated': 'instance_terminated'
+}
+_WAITER_DELAY = 5
+
+# Schedule times as HH:MM (a single-digit hour is still accepted), range-checked by the pattern itself
+_HHMM = re.compile(r'\A([01]?[0-9]|2[0-3]):([0-5][0-9])\Z')
+
+def _parse_instance_list(value):
+    """Parse a comma-separated "name:instance_id" list into a dict"""
+    return {
+        name.strip(): instance_id.strip()
+        for name, _, instance_id in (entry.partition(':') for entry in value.split(','))
+        if instance_id
+    }
+
 class EC2Manager:
     def __init__(self):
-        """Initialize EC2 manager with AWS credentials or IAM role"""
+        """Create the EC2 manager; AWS clients are set up later by initialize()"""
+        self.ec2_client = None
+        self.cloudwatch = None
+        self.ce_client = None
+
+        self._load_config()
+
+        # Single-instance lookups from concurrent callers are merged into one DescribeInstances call
+        self._describe_batcher = RequestBatcher(
+            self._describe_instances_by_id,
+            window=EC2_DESCRIBE_BATCH_WINDOW_MS / 1000,
+            max_batch=_DESCRIBE_BATCH_SIZE
+        )
+        self._exists_cache = TTLCache(_EXISTS_CACHE_TTL)
+        self._state_cache = TTLCache(_STATE_CACHE_TTL)
+        self._billing_cache = TTLCache(_BILLING_CACHE_TTL, maxsize=1)
+
+        # Daily start/stop jobs: min-heap of (next_fire_ts, instance_id, action), run by one task
+        self.schedules = {}
+        self._schedule_heap = []
+        self._schedule_changed = asyncio.Event()
+        self._schedule_task = None
+
+    async def initialize(self):
+        """Initialize AWS clients with IAM role or access keys, without blocking the event loop"""
+        await asyncio.to_thread(self._create_clients)
+
+    def _create_clients(self):
+        """Create long-lived EC2, CloudWatch and Cost Explorer clients (blocking)"""
         try:
             # First try to create client without credentials (will use IAM role if available)
             logger.info("Attempting to initialize AWS clients using IAM role...")
-            self.ec2_client = boto3.client('ec2', region_name=AWS_REGION)
-            self.cloudwatch = boto3.client('cloudwatch', region_name=AWS_REGION)
+            session = boto3.session.Session(region_name=AWS_REGION)
+            self.ec2_client = session.client('ec2', config=_CLIENT_CONFIG)
+            self.cloudwatch = session.client('cloudwatch', config=_CLIENT_CONFIG)
             
-            # Test the connection by making a simple API call
-            self.ec2_client.describe_instances(MaxResults=5)
+            # Check credentials and permissions with a dry run; AWS answers DryRunOperation without fetching any data
+            try:
+                self.ec2_client.describe_instances(DryRun=True)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'DryRunOperation':
+                    raise
             logger.info("Successfully initialized AWS clients using IAM role")
             
         except Exception as e:
@@ -34,24 +109,31 @@ class EC2Manager:
                 raise Exception("No IAM role available and AWS credentials not configured")
                 
             # Fall back to using access keys
-            self.ec2_client = boto3.client('ec2',
-                aws_access_key_id=AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name=AWS_REGION
-            )
-            self.cloudwatch = boto3.client('cloudwatch',
+            session = boto3.session.Session(
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
                 region_name=AWS_REGION
             )
+            self.ec2_client = session.client('ec2', config=_CLIENT_CONFIG)
+            self.cloudwatch = session.client('cloudwatch', config=_CLIENT_CONFIG)
             logger.info("Successfully initialized AWS clients using access keys")
 
-        self._load_config()
+        # Cost Explorer is only available in us-east-1; build it once instead of per billing request
+        self.ce_client = session.client('ce', region_name='us-east-1', config=_CLIENT_CONFIG)
 
-        # Initialize scheduler
-        self.schedules = {}
-        self.scheduler = AsyncIOScheduler(timezone=self.timezone)
-        self.scheduler.start()
+    async def close(self):
+        """Stop the schedule runner, then close AWS clients and release their connection pools"""
+        if self._schedule_task is not None:
+            self._schedule_task.cancel()
+            try:
+                await self._schedule_task
+            except asyncio.CancelledError:
+                pass
+            self._schedule_task = None
+        for client in (self.ec2_client, self.cloudwatch, self.ce_client):
+            if client is not None:
+                await asyncio.to_thread(client.close)
+        self.ec2_client = self.cloudwatch = self.ce_client = None
 
     def _load_config(self):
         """Load EC2 configuration from environment variables"""
@@ -63,75 +145,91 @@ class EC2Manager:
         self.default_start_time = os.getenv('DEFAULT_START_TIME', '09:00')
         self.default_stop_time = os.getenv('DEFAULT_STOP_TIME', '18:00')
 
-        # Load full control instances
-        full_control = os.getenv('EC2_FULL_CONTROL_INSTANCES', '')
-        self.full_control_instances = {}
-        if full_control:
-            for instance in full_control.split(','):
-                if instance:
-                    name, instance_id = instance.split(':')
-                    self.full_control_instances[name.strip()] = instance_id.strip()
-
-        # Load metrics only instances
-        metrics_only = os.getenv('EC2_METRICS_ONLY_INSTANCES', '')
-        self.metrics_only_instances = {}
-        if metrics_only:
-            for instance in metrics_only.split(','):
-                if instance:
-                    name, instance_id = instance.split(':')
-                    self.metrics_only_instances[name.strip()] = instance_id.strip()
+        # Load full control and metrics only instances ("name:id,name:id")
+        self.full_control_instances = _parse_instance_list(os.getenv('EC2_FULL_CONTROL_INSTANCES', ''))
+        self.metrics_only_instances = _parse_instance_list(os.getenv('EC2_METRICS_ONLY_INSTANCES', ''))
 
         # Combined instances
-        self.all_instances = {**self.full_control_instances, **self.metrics_only_instances}
+        self.all_instances = self.full_control_instances | self.metrics_only_instances
+        self._id_to_name = {instance_id: name for name, instance_id in self.all_instances.items()}
+        # Names and IDs accepted by is_full_control
+        self._full_control_keys = frozenset(self.full_control_instances) | frozenset(self.full_control_instances.values())
 
     def is_full_control(self, instance_id: str) -> bool:
-        """Check if an instance is full control"""
-        # First check if the input is a name
-        if instance_id in self.full_control_instances:
-            return True
-        # Then check if it's an ID
-        return instance_id in self.full_control_instances.values()
+        """Check if an instance is full control (accepts either a name or an ID)"""
+        return instance_id in self._full_control_keys
 
     def get_instance_name(self, instance_id: str) -> str:
         """Get instance name from id"""
-        for name, id in self.all_instances.items():
-            if id == instance_id:
-                return name
-        return instance_id
+        return self._id_to_name.get(instance_id, instance_id)
 
     def get_instance_id(self, name: str) -> str:
         """Get instance id from name"""
         return self.all_instances.get(name)
 
+    async def _describe_instances_by_id(self, instance_ids):
+        """
+        Describe many instances with as few DescribeInstances calls as possible.
+
+        Returns:
+            dict: instance_id -> instance description (missing IDs are left out)
+        """
+        instances = {}
+        for i in range(0, len(instance_ids), _DESCRIBE_BATCH_SIZE):
+            chunk = instance_ids[i:i + _DESCRIBE_BATCH_SIZE]
+            try:
+                response = await asyncio.to_thread(self.ec2_client.describe_instances, InstanceIds=chunk)
+                responses = [response]
+            except ClientError as e:
+                if not e.response['Error']['Code'].startswith('InvalidInstanceID'):
+                    raise
+                # One bad ID fails the whole request; fall back to per-instance lookups for this chunk
+                logger.warning(f"Batched describe failed ({e.response['Error']['Code']}), retrying per instance")
+                responses = await asyncio.gather(
+                    *(asyncio.to_thread(self.ec2_client.describe_instances, InstanceIds=[iid]) for iid in chunk),
+                    return_exceptions=True
+                )
+            for response in responses:
+                if isinstance(response, Exception):
+                    logger.error(f"Error describing instance: {str(response)}")
+                    continue
+                for reservation in response['Reservations']:
+                    for instance in reservation['Instances']:
+                        instances[instance['InstanceId']] = instance
+        return instances
+
     async def list_instances(self):
         """List all EC2 instances with their status"""
         results = []
+        try:
+            instances = await self._describe_instances_by_id(list(self.all_instances.values()))
+        except Exception as e:
+            logger.error(f"Error describing EC2 instances: {str(e)}")
+            return results
         
         for name, instance_id in self.all_instances.items():
-            try:
-                # Get instance details
-                response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-                instance = response['Reservations'][0]['Instances'][0]
-                
-                # Get instance name tag
-                instance_name = ''
-                for tag in instance.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        instance_name = tag['Value']
-                        break
-                
-                status = instance['State']['Name']
-                instance_type = "Full Control" if self.is_full_control(instance_id) else "Metrics Only"
-                
-                results.append({
-                    'name': name,
-                    'id': instance_id,
-                    'status': status,
-                    'type': instance_type,
-                    'ec2_name': instance_name
-                })
-            except Exception as e:
-                logger.error(f"Error getting status for {name}: {str(e)}")
+            instance = instances.get(instance_id)
+            if instance is None:
+                logger.error(f"Error getting status for {name}: instance {instance_id} not found")
+                continue
+            
+            # Get instance name tag
+            instance_name = ''
+            for tag in instance.get('Tags', []):
+                if tag['Key'] == 'Name':
+                    instance_name = tag['Value']
+                    break
+            
+            status = instance['State']['Name']
+            instance_type = "Full Control" if self.is_full_control(instance_id) else "Metrics Only"
+            
+            results.append({
+                'name': name,
+                'id': instance_id,
+                'status': status,
+                'type': instance_type,
+                'ec2_name': instance_name
+            })
                 
         return results
 
@@ -142,11 +240,16 @@ class EC2Manager:
             if instance_id in self.all_instances:
                 instance_id = self.all_instances[instance_id]
 
+            # Refuse unknown instances before spending an API call on them
+            if instance_id not in self._id_to_name:
+                return False, f"Không tìm thấy instance: {instance_id}"
+
             # Check if instance is full control
             if not self.is_full_control(instance_id):
                 return False, "Không có quyền start instance này"
 
-            response = self.ec2_client.start_instances(InstanceIds=[instance_id])
+            response = await asyncio.to_thread(self.ec2_client.start_instances, InstanceIds=[instance_id])
+            self._state_cache.invalidate(instance_id)
             logger.info(f"Starting EC2 instance: {instance_id}")
             return True, f"Đang khởi động EC2 instance: {self.get_instance_name(instance_id)}"
         except Exception as e:
@@ -160,23 +263,52 @@ class EC2Manager:
             if instance_id in self.all_instances:
                 instance_id = self.all_instances[instance_id]
 
+            # Refuse unknown instances before spending an API call on them
+            if instance_id not in self._id_to_name:
+                return False, f"Không tìm thấy instance: {instance_id}"
+
             # Check if instance is full control
             if not self.is_full_control(instance_id):
                 return False, "Không có quyền stop instance này"
 
-            response = self.ec2_client.stop_instances(InstanceIds=[instance_id])
+            response = await asyncio.to_thread(self.ec2_client.stop_instances, InstanceIds=[instance_id])
+            self._state_cache.invalidate(instance_id)
             logger.info(f"Stopping EC2 instance: {instance_id}")
             return True, f"Đang tắt EC2 instance: {self.get_instance_name(instance_id)}"
         except Exception as e:
             logger.error(f"Error stopping EC2 instance: {str(e)}")
             return False, f"Lỗi khi tắt EC2 instance: {str(e)}"
 
+    async def describe_instance(self, instance_id: str):
+        """
+        Describe one EC2 instance through the batched DescribeInstances lookup.
+
+        Returns:
+            dict: The instance description, or None if the instance is not found
+        """
+        instance = await self._describe_batcher.get(instance_id)
+        if instance is not None:
+            self._state_cache.set(instance_id, instance['State']['Name'])
+        return instance
+
+    async def _lookup_state(self, instance_id: str):
+        """Return the instance state name (briefly cached), or None if the instance is not found"""
+        state = self._state_cache.get(instance_id)
+        if state is None:
+            instance = await self._describe_batcher.get(instance_id)
+            if instance is None:
+                return None
+            state = instance['State']['Name']
+            self._state_cache.set(instance_id, state)
+        return state
+
     async def get_instance_status(self, instance_id: str):
         """Get status of an EC2 instance"""
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            status = response['Reservations'][0]['Instances'][0]['State']['Name']
-            return status
+            state = await self._lookup_state(instance_id)
+            if state is None:
+                raise Exception(f"Instance {instance_id} not found")
+            return state
         except Exception as e:
             logger.error(f"Error getting EC2 status: {str(e)}")
             return "unknown"
@@ -184,7 +316,7 @@ class EC2Manager:
     async def get_instance_metrics(self, instance_id: str):
         """Get metrics for an EC2 instance"""
         try:
-            end_time = datetime.datetime.utcnow()
+            end_time = datetime.datetime.now(datetime.timezone.utc)
             start_time = end_time - datetime.timedelta(hours=1)
 
             metrics = {
@@ -210,21 +342,35 @@ class EC2Manager:
                 }
             }
 
-            results = {}
-            for metric_name, metric_info in metrics.items():
-                response = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/EC2',
-                    MetricName=metric_info['MetricName'],
-                    Dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,
-                    Statistics=['Average']
-                )
+            # One GetMetricData request covers every metric
+            queries = [
+                {
+                    'Id': f"m{i}",
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/EC2',
+                            'MetricName': metric_info['MetricName'],
+                            'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                        },
+                        'Period': 300,
+                        'Stat': 'Average'
+                    }
+                }
+                for i, metric_info in enumerate(metrics.values())
+            ]
+            response = await asyncio.to_thread(
+                self.cloudwatch.get_metric_data,
+                MetricDataQueries=queries,
+                StartTime=start_time,
+                EndTime=end_time
+            )
+            data = {result['Id']: result for result in response['MetricDataResults']}
 
-                if response['Datapoints']:
-                    latest = max(response['Datapoints'], key=lambda x: x['Timestamp'])
-                    value = latest['Average']
+            results = {}
+            for i, (metric_name, metric_info) in enumerate(metrics.items()):
+                result = data.get(f"m{i}", {})
+                if result.get('Values'):
+                    _, value = max(zip(result['Timestamps'], result['Values']), key=lambda x: x[0])
                     
                     if metric_info['Unit'] == 'Bytes':
                         value = f"{value / (1024 * 1024):.2f} MB"
@@ -245,88 +391,67 @@ class EC2Manager:
     async def add_schedule(self, instance_id, server_name, start_time=None, stop_time=None):
         """Add a schedule for an EC2 instance"""
         try:
-            logger.info(f"Adding schedule - Instance: {server_name} ({instance_id}) | Start: {start_time} | Stop: {stop_time}")
+            logger.info("Adding schedule - Instance: %s (%s) | Start: %s | Stop: %s", server_name, instance_id, start_time, stop_time)
             
             # Use default times if not provided
             start_time = start_time or self.default_start_time
             stop_time = stop_time or self.default_stop_time
-            logger.info(f"Using times - Start: {start_time} | Stop: {stop_time} (default times used if None provided)")
+            logger.debug("Using times - Start: %s | Stop: %s (default times used if None provided)", start_time, stop_time)
 
             # Validate instance
             exists = await self.instance_exists(instance_id)
-            logger.info(f"Instance existence check - ID: {instance_id} | Exists: {exists}")
+            logger.debug("Instance existence check - ID: %s | Exists: %s", instance_id, exists)
             if not exists:
-                logger.warning(f"Instance not found: {instance_id}")
+                logger.warning("Instance not found: %s", instance_id)
                 return False, "Instance không tồn tại"
 
             # Check schedule limit
-            if len(self.schedules) >= self.max_schedules_per_instance:
-                logger.warning(f"Schedule limit reached for instance {instance_id} - Current: {len(self.schedules)} | Max: {self.max_schedules_per_instance}")
+            schedule_count = len(self.schedules)
+            if schedule_count >= self.max_schedules_per_instance:
+                logger.warning("Schedule limit reached for instance %s - Current: %s | Max: %s",
+                               instance_id, schedule_count, self.max_schedules_per_instance)
                 return False, f"Đã đạt giới hạn {self.max_schedules_per_instance} schedule cho mỗi instance"
 
             # Parse times
-            try:
-                logger.info(f"Parsing time values - Start: {start_time} | Stop: {stop_time}")
-                start_hour, start_minute = map(int, start_time.split(':'))
-                stop_hour, stop_minute = map(int, stop_time.split(':'))
-                
-                # Validate hour and minute ranges
-                if not (0 <= start_hour <= 23 and 0 <= start_minute <= 59):
-                    logger.warning(f"Invalid start time - Hour: {start_hour} | Minute: {start_minute}")
-                    return False, "Giờ bật không hợp lệ. Giờ phải từ 00-23, phút phải từ 00-59"
-                if not (0 <= stop_hour <= 23 and 0 <= stop_minute <= 59):
-                    logger.warning(f"Invalid stop time - Hour: {stop_hour} | Minute: {stop_minute}")
-                    return False, "Giờ tắt không hợp lệ. Giờ phải từ 00-23, phút phải từ 00-59"
-                    
-                # Convert to minutes for comparison
-                start_minutes = start_hour * 60 + start_minute
-                stop_minutes = stop_hour * 60 + stop_minute
-                logger.info(f"Time comparison - Start minutes: {start_minutes} | Stop minutes: {stop_minutes}")
-                
-                # Ensure stop time is after start time
-                if stop_minutes <= start_minutes:
-                    logger.warning(f"Invalid time range - Stop time must be after start time")
-                    return False, "Giờ tắt phải sau giờ bật"
-                    
-            except ValueError as e:
-                logger.error(f"Time parsing error: {str(e)}")
-                return False, "Format thởi gian không hợp lệ. Sử dụng HH:MM"
+            logger.debug("Parsing time values - Start: %s | Stop: %s", start_time, stop_time)
+            start_match = _HHMM.match(start_time)
+            if not start_match:
+                logger.warning("Invalid start time: %s", start_time)
+                return False, "Giờ bật không hợp lệ. Sử dụng HH:MM, giờ phải từ 00-23, phút phải từ 00-59"
+            stop_match = _HHMM.match(stop_time)
+            if not stop_match:
+                logger.warning("Invalid stop time: %s", stop_time)
+                return False, "Giờ tắt không hợp lệ. Sử dụng HH:MM, giờ phải từ 00-23, phút phải từ 00-59"
+
+            start_hour, start_minute = int(start_match[1]), int(start_match[2])
+            stop_hour, stop_minute = int(stop_match[1]), int(stop_match[2])
+
+            # Convert to minutes for comparison
+            start_minutes = start_hour * 60 + start_minute
+            stop_minutes = stop_hour * 60 + stop_minute
+            logger.debug("Time comparison - Start minutes: %s | Stop minutes: %s", start_minutes, stop_minutes)
+
+            # Ensure stop time is after start time
+            if stop_minutes <= start_minutes:
+                logger.warning("Invalid time range - Stop time must be after start time")
+                return False, "Giờ tắt phải sau giờ bật"
 
             # Calculate expiration
             expiration_date = datetime.datetime.now() + datetime.timedelta(days=self.schedule_retention_days)
-            logger.info(f"Schedule expiration set to: {expiration_date}")
+            logger.debug("Schedule expiration set to: %s", expiration_date)
 
             # Remove existing schedule if any
             if instance_id in self.schedules:
-                logger.info(f"Removing existing schedule for instance {instance_id}")
-                self.scheduler.remove_job(f"start_{instance_id}")
-                self.scheduler.remove_job(f"stop_{instance_id}")
+                logger.info("Removing existing schedule for instance %s", instance_id)
+                self._drop_schedule_jobs(instance_id)
 
             # Add start job
-            logger.info(f"Adding start job - Hour: {start_hour} | Minute: {start_minute}")
-            self.scheduler.add_job(
-                self.start_instance,
-                'cron',
-                hour=start_hour,
-                minute=start_minute,
-                id=f"start_{instance_id}",
-                args=[instance_id],
-                timezone=self.timezone,
-                replace_existing=True
-            )
+            logger.debug("Adding start job - Hour: %s | Minute: %s", start_hour, start_minute)
+            heapq.heappush(self._schedule_heap, (self._next_fire_time(start_hour, start_minute), instance_id, 'start'))
 
             # Add stop job
-            logger.info(f"Adding stop job - Hour: {stop_hour} | Minute: {stop_minute}")
-            self.scheduler.add_job(
-                self.stop_instance,
-                'cron',
-                hour=stop_hour,
-                minute=stop_minute,
-                id=f"stop_{instance_id}",
-                args=[instance_id],
-                timezone=self.timezone,
-                replace_existing=True
-            )
+            logger.debug("Adding stop job - Hour: %s | Minute: %s", stop_hour, stop_minute)
+            heapq.heappush(self._schedule_heap, (self._next_fire_time(stop_hour, stop_minute), instance_id, 'stop'))
 
             # Store schedule info
             self.schedules[instance_id] = {
@@ -335,25 +460,83 @@ class EC2Manager:
                 'stop_time': stop_time,
                 'timezone': self.timezone,
                 'created_at': datetime.datetime.now().isoformat(),
-                'expires_at': expiration_date.isoformat()
+                'expires_at': expiration_date.isoformat(),
+                # Numeric copy of expires_at so cleanup doesn't parse ISO strings
+                'expires_at_ts': expiration_date.timestamp()
             }
-            logger.info(f"Schedule stored successfully for instance {instance_id}")
+            logger.info("Schedule stored successfully for instance %s", instance_id)
+            self._wake_scheduler()
 
             return True, f"Schedule đã được thiết lập cho instance {server_name}"
 
         except Exception as e:
-            logger.error(f"Error setting schedule: {str(e)}", exc_info=True)
+            logger.error("Error setting schedule: %s", e, exc_info=True)
             return False, f"Lỗi khi thiết lập schedule: {str(e)}"
 
+    def _next_fire_time(self, hour, minute):
+        """Unix timestamp of the next hour:minute in the configured timezone"""
+        tz = pytz.timezone(self.timezone)
+        now = datetime.datetime.now(tz)
+        day = now.date()
+        while True:
+            fire_at = tz.localize(datetime.datetime(day.year, day.month, day.day, hour, minute))
+            if fire_at > now:
+                return fire_at.timestamp()
+            day += datetime.timedelta(days=1)
+
+    def _drop_schedule_jobs(self, instance_id):
+        """Remove both daily jobs of an instance from the heap"""
+        self._schedule_heap = [job for job in self._schedule_heap if job[1] != instance_id]
+        heapq.heapify(self._schedule_heap)
+
+    def _wake_scheduler(self):
+        """Start the scheduler task on first use and make it re-check the earliest job"""
+        if self._schedule_task is None or self._schedule_task.done():
+            self._schedule_task = asyncio.create_task(self._run_schedules())
+        self._schedule_changed.set()
+
+    async def _run_schedules(self):
+        """Sleep until the earliest job is due, run it, and requeue it for the next day"""
+        while True:
+            self._schedule_changed.clear()
+            if not self._schedule_heap:
+                await self._schedule_changed.wait()
+                continue
+
+            delay = self._schedule_heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._schedule_changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, instance_id, action = heapq.heappop(self._schedule_heap)
+            schedule = self.schedules.get(instance_id)
+            if schedule is None:
+                continue
+
+            hour, minute = map(int, schedule[f"{action}_time"].split(':'))
+            heapq.heappush(self._schedule_heap, (self._next_fire_time(hour, minute), instance_id, action))
+
+            logger.info("Running scheduled %s for instance %s", action, instance_id)
+            try:
+                if action == 'start':
+                    await self.start_instance(instance_id)
+                else:
+                    await self.stop_instance(instance_id)
+            except Exception as e:
+                logger.error("Error running scheduled %s for %s: %s", action, instance_id, e)
+
     async def remove_schedule(self, instance_id):
         """Remove schedule for an EC2 instance"""
         try:
             if instance_id not in self.schedules:
                 return False, "Không tìm thấy schedule cho instance này"
 
-            self.scheduler.remove_job(f"start_{instance_id}")
-            self.scheduler.remove_job(f"stop_{instance_id}")
+            self._drop_schedule_jobs(instance_id)
             del self.schedules[instance_id]
+            self._wake_scheduler()
 
             return True, "Schedule đã được xóa"
         except Exception as e:
@@ -370,47 +553,47 @@ class EC2Manager:
 
     async def cleanup_expired_schedules(self):
         """Clean up expired schedules"""
-        now = datetime.datetime.now()
-        expired = []
-        
-        for instance_id, schedule in self.schedules.items():
-            expiration = datetime.datetime.fromisoformat(schedule['expires_at'])
-            if now > expiration:
-                expired.append(instance_id)
+        now_ts = time.time()
+        expired = [
+            instance_id for instance_id, schedule in self.schedules.items()
+            if schedule['expires_at_ts'] < now_ts
+        ]
         
         for instance_id in expired:
             await self.remove_schedule(instance_id)
 
     async def instance_exists(self, instance_id: str) -> bool:
         """Check if an EC2 instance exists"""
-        try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            return len(response['Reservations']) > 0
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                return False
-            raise e
+        # Only configured instances are managed by the bot; skip AWS for anything else
+        if instance_id not in self._id_to_name:
+            return False
+
+        exists = self._exists_cache.get(instance_id)
+        if exists is None:
+            exists = await self._describe_batcher.get(instance_id) is not None
+            self._exists_cache.set(instance_id, exists)
+        return exists
 
     async def get_account_billing(self):
         """Get AWS account billing information for the current month"""
         try:
-            # Create Cost Explorer client
-            ce = boto3.client(
-                'ce',
-                aws_access_key_id=AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name='us-east-1'  # Cost Explorer is only available in us-east-1
-            )
-            
             # Get start and end dates for current month
             now = datetime.datetime.now()
             start_of_month = datetime.datetime(now.year, now.month, 1)
+
+            # Keyed by month so a cached result never crosses a month rollover
+            cache_key = (now.year, now.month)
+            cached = self._billing_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached billing information")
+                return True, cached
             
-            logger.info(f"Getting billing information from {start_of_month.strftime('%Y-%m-%d')} to {now.strftime('%Y-%m-%d')}")
+            logger.info("Getting billing information from %s to %s", start_of_month.strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d'))
             
             # Get total costs with service breakdown
-            logger.info("Calling Cost Explorer API...")
-            response = ce.get_cost_and_usage(
+            logger.debug("Calling Cost Explorer API...")
+            response = await asyncio.to_thread(
+                self.ce_client.get_cost_and_usage,
                 TimePeriod={
                     'Start': start_of_month.strftime('%Y-%m-%d'),
                     'End': now.strftime('%Y-%m-%d')
@@ -422,8 +605,9 @@ class EC2Manager:
                 ]
             )
             
-            logger.info(f"Response structure: {list(response.keys())}")
-            logger.debug(f"Full response: {response}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response structure: %s", list(response.keys()))
+                logger.debug("Full response: %s", response)
             
             if 'ResultsByTime' not in response:
                 logger.error(f"ResultsByTime not found in response. Response keys: {list(response.keys())}")
@@ -434,8 +618,9 @@ class EC2Manager:
                 return False, "No billing data available for the current month"
                 
             result = response['ResultsByTime'][0]
-            logger.info(f"Result structure: {list(result.keys())}")
-            logger.debug(f"Full result: {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result structure: %s", list(result.keys()))
+                logger.debug("Full result: %s", result)
             
             # Get total cost
             if 'Total' not in result:
@@ -443,25 +628,30 @@ class EC2Manager:
                 return False, "Missing total cost information"
                 
             total_data = result['Total']
-            logger.info(f"Total data structure: {total_data}")
+            logger.debug("Total data structure: %s", total_data)
             
-            # Try to get cost from Groups if Total is empty
-            if not total_data and 'Groups' in result:
-                logger.info("Total is empty, calculating from Groups")
-                total = 0
-                currency = 'USD'  # Default currency
-                
-                for group in result['Groups']:
-                    try:
-                        cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                        total += cost
-                        currency = group['Metrics']['UnblendedCost']['Unit']
-                        logger.debug(f"Added cost from group: ${cost:.2f} {currency}")
-                    except (KeyError, ValueError) as e:
-                        logger.warning(f"Error processing group cost: {str(e)}")
-                        continue
+            # One pass over the service groups: per-service costs plus a fallback total
+            services = []
+            groups_total = 0.0
+            groups_currency = 'USD'  # Default currency
+            for group in result.get('Groups', []):
+                try:
+                    service_name = group['Keys'][0]
+                    cost = float(group['Metrics']['UnblendedCost']['Amount'])
+                    groups_total += cost
+                    groups_currency = group['Metrics']['UnblendedCost']['Unit']
+                    if cost > 0:  # Only include services with costs
+                        services.append((service_name, round(cost, 2)))
+                        logger.debug("Service cost: %s = $%.2f", service_name, cost)
+                except (KeyError, ValueError) as e:
+                    logger.warning(f"Error processing group {group}: {str(e)}")
+                    continue
             
-                logger.info(f"Calculated total from groups: ${total:.2f} {currency}")
+            # Use the group sum if Total is empty
+            if not total_data and 'Groups' in result:
+                total = groups_total
+                currency = groups_currency
+                logger.info("Total is empty, calculated from groups: $%.2f %s", total, currency)
             else:
                 if 'UnblendedCost' not in total_data:
                     logger.error(f"UnblendedCost not found in Total. Total keys: {list(total_data.keys())}")
@@ -470,32 +660,22 @@ class EC2Manager:
                 total = float(total_data['UnblendedCost']['Amount'])
                 currency = total_data['UnblendedCost']['Unit']
                 
-            logger.info(f"Total cost: ${total:.2f} {currency}")
-            
-            # Get service-wise costs
-            services = {}
-            for group in result.get('Groups', []):
-                try:
-                    service_name = group['Keys'][0]
-                    cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                    if cost > 0:  # Only include services with costs
-                        services[service_name] = round(cost, 2)
-                        logger.debug(f"Service cost: {service_name} = ${cost:.2f}")
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Error processing group {group}: {str(e)}")
-                    continue
+            logger.info("Total cost: $%.2f %s", total, currency)
             
             # Sort services by cost
-            sorted_services = dict(sorted(services.items(), key=lambda x: x[1], reverse=True))
-            logger.info(f"Found {len(sorted_services)} services with costs")
+            services.sort(key=lambda x: x[1], reverse=True)
+            sorted_services = dict(services)
+            logger.debug("Found %s services with costs", len(sorted_services))
             
-            return True, {
+            billing = {
                 'start_date': start_of_month.strftime('%Y-%m-%d'),
                 'end_date': now.strftime('%Y-%m-%d'),
                 'total_cost': f"{total:.2f}",
                 'currency': currency,
                 'services': sorted_services
             }
+            self._billing_cache.set(cache_key, billing)
+            return True, billing
                 
         except Exception as e:
             logger.error(f"Error getting billing information: {str(e)}")
@@ -509,14 +689,41 @@ class EC2Manager:
             tuple: (success: bool, state: str)
         """
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            state = response['Reservations'][0]['Instances'][0]['State']['Name']
-            logger.info(f"Got instance state for {instance_id}: {state}")
+            state = await self._lookup_state(instance_id)
+            if state is None:
+                return False, f"Instance {instance_id} not found"
+            logger.debug("Got instance state for %s: %s", instance_id, state)
             return True, state
         except Exception as e:
             logger.error(f"Error getting instance state: {str(e)}")
             return False, str(e)
 
+    async def _wait_with_waiter(self, instance_id: str, target_state: str, waiter_name: str, timeout: int):
+        """Block on a boto3 EC2 waiter in a worker thread; returns (success, message) like wait_for_state"""
+        try:
+            waiter = self.ec2_client.get_waiter(waiter_name)
+            logger.info("Waiting for state - Instance: %s | Target: %s | Waiter: %s", instance_id, target_state, waiter_name)
+            await asyncio.to_thread(
+                waiter.wait,
+                InstanceIds=[instance_id],
+                WaiterConfig={'Delay': _WAITER_DELAY, 'MaxAttempts': max(1, timeout // _WAITER_DELAY)}
+            )
+            return True, f"Instance đã {target_state}"
+        except WaiterError as e:
+            if 'Max attempts exceeded' in str(e):
+                return False, f"Timeout khi chờ instance {target_state}"
+            # The waiter stops early when the instance enters a state it can't recover from
+            try:
+                current_state = e.last_response['Reservations'][0]['Instances'][0]['State']['Name']
+            except (KeyError, IndexError, TypeError):
+                current_state = 'unknown'
+            return False, f"Instance trong trạng thái không hợp lệ: {current_state}"
+        except Exception as e:
+            logger.error(f"Error waiting for state: {str(e)}")
+            return False, f"Lỗi khi chờ trạng thái: {str(e)}"
+        finally:
+            self._state_cache.invalidate(instance_id)
+
     async def wait_for_state(self, instance_id: str, target_state: str, timeout: int = 300):
         """Wait for instance to reach target state
         
@@ -528,11 +735,16 @@ class EC2Manager:
         Returns:
             tuple: (success: bool, message: str)
         """
+        waiter_name = _STATE_WAITERS.get(target_state)
+        if waiter_name:
+            return await self._wait_with_waiter(instance_id, target_state, waiter_name, timeout)
+
         try:
-            start_time = datetime.datetime.now()
-            while (datetime.datetime.now() - start_time).seconds < timeout:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while loop.time() < deadline:
                 success, current_state = await self.get_instance_state(instance_id)
-                logger.info(f"Waiting for state - Instance: {instance_id} | Current: {current_state} | Target: {target_state}")
+                logger.debug("Waiting for state - Instance: %s | Current: %s | Target: %s", instance_id, current_state, target_state)
                 
                 if not success:
                     return False, f"Lỗi khi kiểm tra trạng thái: {current_state}"
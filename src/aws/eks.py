@@ -1,5 +1,5 @@
 import boto3
-import json
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from ..config import (
     AWS_ACCESS_KEY_ID, 
@@ -7,166 +7,531 @@ from ..config import (
     AWS_REGION,
     EKS_CLUSTER_NAME
 )
-from ..utils.logger import get_logger
+from ..utils.logger import correlation_id, get_logger
+from ..utils.helpers import LazyJson, TTLCache, json_loads
 import time
 import asyncio
+import logging
+import functools
+import types
+import random
+import atexit
+import base64
+import tempfile
+import uuid
 from datetime import datetime, timezone
-import yaml
-from kubernetes import client, config
 import os
 
 logger = get_logger(__name__)
 
+# Map AWS regions to pricing API location names (read-only)
+_PRICING_REGION_MAP = types.MappingProxyType({
+    'ap-southeast-1': 'Asia Pacific (Singapore)',
+    'us-east-1': 'US East (N. Virginia)',
+    'us-west-2': 'US West (Oregon)',
+    'ap-northeast-1': 'Asia Pacific (Tokyo)',
+    'eu-west-1': 'EU (Ireland)',
+    'eu-central-1': 'EU (Frankfurt)'
+})
+
+# Keep connections alive and pooled for concurrent describe fan-out; adaptive retries absorb throttling
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=15,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# The long-lived EKS client is rebuilt after this many calls or seconds so stale pooled sockets don't pile up
+_CLIENT_RECYCLE_CALLS = 10000
+_CLIENT_RECYCLE_SECONDS = 6 * 60 * 60
+
+# Concurrent DescribeNodegroup calls, kept low to stay under EKS API throttling
+_DESCRIBE_CONCURRENCY = 16
+_THROTTLE_CODES = frozenset({'Throttling', 'ThrottlingException', 'TooManyRequestsException', 'RequestLimitExceeded'})
+_THROTTLE_MAX_RETRIES = 6
+_THROTTLE_BASE_DELAY = 0.5
+_THROTTLE_MAX_DELAY = 15
+
+_VALID_CAPACITY_TYPES = frozenset({'ON_DEMAND', 'SPOT'})
+# Nodegroup states that polling treats as failed
+_TERMINAL_FAILED_STATES = frozenset({'CREATE_FAILED', 'DELETE_FAILED', 'DEGRADED'})
+
+# list_nodegroups results are reused for this many seconds
+_NODEGROUP_CACHE_TTL = 30
+# Single describe_nodegroup results are reused briefly; ARNs never change while a nodegroup exists
+_DESCRIBE_CACHE_TTL = 15
+_ARN_CACHE_TTL = 300
+
+# Nodegroup status polling backs off from the initial delay, doubling up to the cap (seconds)
+_POLL_INITIAL_DELAY = 5
+_POLL_MAX_DELAY = 60
+_NODEGROUP_WAIT_TIMEOUT = 20 * 60
+# EKS bearer tokens are valid for 15 minutes; reuse one until shortly before it expires
+_BEARER_TOKEN_TTL = 14 * 60
+# Deletion monitoring starts polling quickly and slows down while the status stays the same
+_DELETE_POLL_INITIAL_DELAY = 2
+_DELETE_POLL_MAX_DELAY = 15
+# Upper bound on waiting for a graceful scale-down to register before deleting anyway
+_SCALE_DOWN_WAIT_TIMEOUT = 60
+# While a nodegroup is DELETING only every Nth check describes it; the others just list nodegroup names
+_DELETE_DESCRIBE_EVERY = 4
+
+# Defaults for create_performance_nodegroup; read-only, callers override keys on a copy.
+# The nested labels/taints are handed to boto3 as-is and never mutated.
+_DEFAULT_PERF_CFG = types.MappingProxyType({
+    'ami_type': 'AL2023_x86_64_STANDARD',  # Latest Amazon Linux 2023
+    'instance_types': ['c7i.xlarge'],      # Latest compute-optimized instance
+    'min_size': 1,
+    'max_size': 1,
+    'desired_size': 1,
+    'capacity_type': 'ON_DEMAND',
+    'disk_size': 50,
+    'labels': {
+        'component': 'performance-test'
+    },
+    'taints': [{
+        'key': 'component',
+        'value': 'performance-test',
+        'effect': 'NO_SCHEDULE'
+    }]
+})
+
+# On-demand prices change on a scale of hours to days; parsed prices are reused for 6 hours
+_PRICE_CACHE_TTL = 6 * 60 * 60
+_price_cache = TTLCache(ttl=_PRICE_CACHE_TTL, maxsize=256)
+_pricing_client = None
+# Average month length (30.44 days) in hours, for hourly -> monthly cost
+_HOURS_PER_MONTH = 24 * 30.44
+# SPOT is estimated as a fixed fraction of the on-demand price (70% discount)
+_SPOT_PRICE_RATIO = 0.3
+
+def _get_pricing_client():
+    """Return the shared Pricing API client, creating it on first use"""
+    global _pricing_client
+    if _pricing_client is None:
+        # Pricing API is only available in us-east-1
+        _pricing_client = boto3.client('pricing', region_name='us-east-1', config=_CLIENT_CONFIG)
+    return _pricing_client
+
+def _extract_on_demand_usd(raw_price_item):
+    """
+    Return the first on-demand USD price in one Pricing API PriceList entry.
+    Only the terms.OnDemand subtree is walked; raises LookupError when it has no USD price.
+    """
+    on_demand_terms = json_loads(raw_price_item).get('terms', {}).get('OnDemand')
+    if not on_demand_terms:
+        raise LookupError("No OnDemand pricing terms found")
+
+    for offer in on_demand_terms.values():
+        for dimension in offer.get('priceDimensions', {}).values():
+            usd = dimension.get('pricePerUnit', {}).get('USD')
+            if usd is not None:
+                return float(usd)
+    raise LookupError("No USD price in OnDemand pricing terms")
+
+def _get_on_demand_price(instance_type, location):
+    """
+    Look up the on-demand hourly price of one node from the AWS Pricing API.
+    Blocking; results are cached per (instance_type, location) for _PRICE_CACHE_TTL.
+    Raises ValueError when no usable price is found.
+    """
+    cached = _price_cache.get((instance_type, location))
+    if cached is not None:
+        return cached
+
+    pricing = _get_pricing_client()
+    logger.info("Getting pricing for %s in %s", instance_type, location)
+
+    filters = [
+        {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
+        {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
+        {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': location},
+        {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
+        {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'},
+        {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'}
+    ]
+
+    response = pricing.get_products(
+        ServiceCode='AmazonEC2',
+        Filters=filters,
+        MaxResults=1
+    )
+
+    if not response.get('PriceList'):
+        raise ValueError(f"No pricing found for {instance_type} in {location}")
+
+    try:
+        on_demand_price = _extract_on_demand_usd(response['PriceList'][0])
+    except LookupError as e:
+        raise ValueError(f"Error parsing pricing data for {instance_type}: {str(e)}")
+
+    if on_demand_price <= 0:
+        raise ValueError(f"Invalid price (${on_demand_price}) found for {instance_type}")
+
+    logger.info("Found OnDemand price: $%s/hour", on_demand_price)
+    _price_cache.set((instance_type, location), on_demand_price)
+    return on_demand_price
+
+def _remove_file(path):
+    """Delete a file if it still exists; used to clean up temp files at exit"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 class EKSManager:
-    def __init__(self):
+    def __init__(self, max_parallel_requests=_DESCRIBE_CONCURRENCY):
         try:
             # Initialize AWS clients
-            self.eks_client = boto3.client(
-                'eks',
-                aws_access_key_id=AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name=AWS_REGION
-            )
+            self.eks_client = self._new_eks_client()
+            # botocore builds modeled exception classes lazily; resolve the one status polling catches once
+            self._resource_not_found = self.eks_client.exceptions.ResourceNotFoundException
+            self._calls_since_reset = 0
+            self._client_created_at = time.monotonic()
             self.sts_client = boto3.client(
                 'sts',
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name=AWS_REGION
+                region_name=AWS_REGION,
+                config=_CLIENT_CONFIG
             )
             self.cluster_name = EKS_CLUSTER_NAME
-            
-            # Test connection and permissions
+            self._max_parallel_requests = max_parallel_requests
+            self._nodegroups_cache = None
+            self._nodegroups_cache_ts = 0
+            # Bumped on every invalidation; a fetch that started under an older generation must not be cached
+            self._cache_generation = 0
+            self._ng_cache = TTLCache(ttl=_DESCRIBE_CACHE_TTL)
+            self._arn_cache = TTLCache(ttl=_ARN_CACHE_TTL)
+            self._inflight = {}
+
+            # Cluster info, node role and subnets are fetched on first use by _ensure_bootstrap
+            self.cluster_info = None
+            self.node_role_arn = None
+            self.subnets = None
+            self._account_id = None
+            self._bootstrap_lock = None
+
+            # Kubernetes credentials for create_performance_test_pod, reused across pod creations
+            self._ca_cert_path = None
+            self._bearer_token = None
+            self._bearer_token_expires_at = 0
+            self._k8s_configuration = None
+            self._k8s_api = None
+
+        except Exception as e:
+            logger.error("Error initializing EKSManager: %s", e)
+            raise
+
+    async def _ensure_bootstrap(self):
+        """Fetch cluster info, the account ID and the node role/subnets of an existing nodegroup once, on first use"""
+        if self.node_role_arn is not None:
+            return
+        if self._bootstrap_lock is None:
+            self._bootstrap_lock = asyncio.Lock()
+        async with self._bootstrap_lock:
+            if self.node_role_arn is not None:
+                return
             try:
-                response = self.eks_client.describe_cluster(name=self.cluster_name)
-                self.cluster_info = response['cluster']
-                
-                # Get existing nodegroup for configuration reference
-                nodegroups = self.eks_client.list_nodegroups(clusterName=self.cluster_name)['nodegroups']
-                if nodegroups:
-                    ng_info = self.eks_client.describe_nodegroup(
-                        clusterName=self.cluster_name,
-                        nodegroupName=nodegroups[0]
-                    )['nodegroup']
-                    
-                    # Use configuration from existing nodegroup
-                    self.node_role_arn = ng_info['nodeRole']
-                    self.subnets = ng_info['subnets']
-                else:
+                cluster, nodegroups, identity = await asyncio.gather(
+                    self._call(self.eks_client.describe_cluster, name=self.cluster_name),
+                    self._call(self.eks_client.list_nodegroups, clusterName=self.cluster_name, maxResults=1),
+                    self._call(self.sts_client.get_caller_identity)
+                )
+                self.cluster_info = cluster['cluster']
+                self._account_id = identity['Account']
+
+                # Use configuration from an existing nodegroup
+                if not nodegroups['nodegroups']:
                     raise Exception("No existing nodegroups found to get configuration from")
-                    
+                ng_info = await self._describe_nodegroup_cached(nodegroups['nodegroups'][0])
+                self.subnets = ng_info['subnets']
+                self.node_role_arn = ng_info['nodeRole']
             except ClientError as e:
-                logger.error(f"Error accessing EKS cluster: {str(e)}")
+                logger.error("Error accessing EKS cluster: %s", e)
                 raise
-                
-        except Exception as e:
-            logger.error(f"Error initializing EKSManager: {str(e)}")
-            raise
+
+    def get_account_id(self):
+        """Return the AWS account ID cached by _ensure_bootstrap, or None before the first bootstrap"""
+        return self._account_id
+
+    @classmethod
+    async def create(cls, **kwargs):
+        """Build an EKSManager without blocking the event loop on boto3 client setup"""
+        return await asyncio.to_thread(cls, **kwargs)
+
+    async def aclose(self):
+        """Close the boto3 clients and release their connection pools"""
+        for aws_client in (self.eks_client, self.sts_client):
+            await asyncio.to_thread(aws_client.close)
+
+    def _invalidate_nodegroup_cache(self, nodegroup_name, deleted=False):
+        """Drop cached list/describe results after a nodegroup changes; its ARN only goes once it is deleted"""
+        self._cache_generation += 1
+        self._nodegroups_cache_ts = 0
+        self._ng_cache.invalidate(nodegroup_name)
+        if deleted:
+            self._arn_cache.invalidate(nodegroup_name)
+
+    async def _describe_nodegroup_cached(self, nodegroup_name):
+        """Return the describe_nodegroup payload for a nodegroup, reusing results younger than _DESCRIBE_CACHE_TTL"""
+        nodegroup = self._ng_cache.get(nodegroup_name)
+        if nodegroup is not None:
+            return nodegroup
+
+        # Concurrent misses for the same nodegroup share one in-flight describe; a describe started
+        # before an invalidation is never shared with callers that arrive after it
+        generation = self._cache_generation
+        key = ('describe_nodegroup', self.cluster_name, nodegroup_name, generation)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call_with_backoff(
+                self.eks_client.describe_nodegroup,
+                clusterName=self.cluster_name,
+                nodegroupName=nodegroup_name
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._drop_inflight, key))
+
+        # shield so one caller giving up doesn't cancel the describe for the others
+        nodegroup = (await asyncio.shield(task))['nodegroup']
+        if self._cache_generation == generation:
+            self._ng_cache.set(nodegroup_name, nodegroup)
+            self._arn_cache.set(nodegroup_name, nodegroup['nodegroupArn'])
+        return nodegroup
+
+    async def describe_nodegroup(self, nodegroup_name):
+        """
+        Return the describe_nodegroup payload for a nodegroup through the shared cache and backoff
+
+        Raises:
+            ClientError: if the describe fails (e.g. ResourceNotFoundException)
+        """
+        return await self._describe_nodegroup_cached(nodegroup_name)
+
+    async def describe_many_nodegroups(self, nodegroup_names):
+        """
+        Describe several nodegroups concurrently, at most _max_parallel_requests at a time
+
+        Returns:
+            list: describe payloads in the order of nodegroup_names; a failed describe yields its exception
+        """
+        sem = asyncio.Semaphore(self._max_parallel_requests)
+
+        async def describe(ng_name):
+            async with sem:
+                return await self._describe_nodegroup_cached(ng_name)
+
+        return await asyncio.gather(*(describe(ng_name) for ng_name in nodegroup_names), return_exceptions=True)
+
+    def _drop_inflight(self, key, task):
+        """Forget a finished in-flight call; its error has already been delivered to the waiters"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_nodegroup_arn_cached(self, nodegroup_name):
+        """Return a nodegroup ARN, describing the nodegroup only when it isn't cached"""
+        arn = self._arn_cache.get(nodegroup_name)
+        if arn is None:
+            arn = (await self._describe_nodegroup_cached(nodegroup_name))['nodegroupArn']
+        return arn
+
+    def _list_nodegroup_names(self):
+        """Return every nodegroup name in the cluster, following pagination"""
+        names = []
+        paginator = self.eks_client.get_paginator('list_nodegroups')
+        for page in paginator.paginate(clusterName=self.cluster_name):
+            names.extend(page['nodegroups'])
+        return names
+
+    async def get_nodegroup_names(self):
+        """Return every nodegroup name in the cluster without describing them"""
+        return await self._call(self._list_nodegroup_names)
+
+    def _new_eks_client(self):
+        """Build an EKS client with the shared keep-alive/timeout config"""
+        return boto3.client(
+            'eks',
+            aws_access_key_id=AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+            region_name=AWS_REGION,
+            config=_CLIENT_CONFIG
+        )
+
+    def _recycle_eks_client(self):
+        """Swap in a fresh EKS client and close the old one's connection pool (blocking)"""
+        old_client, self.eks_client = self.eks_client, self._new_eks_client()
+        old_client.close()
+        logger.info("Recycled EKS client connection pool")
+
+    async def _call(self, func, **kwargs):
+        """Run a blocking boto3 call in a worker thread so the event loop keeps serving Discord"""
+        owner = getattr(func, '__self__', None)
+        # Only EKS client calls count towards (and can trigger) recycling the EKS client
+        if owner is self.eks_client or func == self._list_nodegroup_names:
+            self._calls_since_reset += 1
+            if (self._calls_since_reset >= _CLIENT_RECYCLE_CALLS
+                    or time.monotonic() - self._client_created_at >= _CLIENT_RECYCLE_SECONDS):
+                # Reset first so concurrent callers don't recycle twice
+                self._calls_since_reset = 0
+                self._client_created_at = time.monotonic()
+                try:
+                    await asyncio.to_thread(self._recycle_eks_client)
+                except Exception as e:
+                    logger.warning("Could not recycle EKS client, keeping the current one: %s", e)
+                if owner is not self and owner is not self.eks_client:
+                    # func is bound to the client that was just replaced
+                    func = getattr(self.eks_client, func.__name__)
+        return await asyncio.to_thread(func, **kwargs)
+
+    async def _call_with_backoff(self, func, **kwargs):
+        """Run a blocking boto3 call in a worker thread, retrying with exponential backoff when throttled"""
+        for attempt in range(_THROTTLE_MAX_RETRIES):
+            try:
+                return await self._call(func, **kwargs)
+            except ClientError as e:
+                if e.response['Error']['Code'] not in _THROTTLE_CODES or attempt == _THROTTLE_MAX_RETRIES - 1:
+                    raise
+                # Full jitter spreads retries from concurrent callers instead of retrying in lockstep
+                delay = random.uniform(0, min(_THROTTLE_MAX_DELAY, _THROTTLE_BASE_DELAY * (2 ** attempt)))
+                logger.warning("%s throttled, retrying in %.1fs", func.__name__, delay)
+                await asyncio.sleep(delay)
 
     async def list_nodegroups(self):
         """List all nodegroups in the cluster with their tags"""
+        now = time.monotonic()
+        if self._nodegroups_cache is not None and now - self._nodegroups_cache_ts < _NODEGROUP_CACHE_TTL:
+            return True, self._nodegroups_cache
+
+        generation = self._cache_generation
         try:
-            logger.info(f"Attempting to list nodegroups for cluster: {self.cluster_name}")
+            logger.info("Attempting to list nodegroups for cluster: %s", self.cluster_name)
             
             # First, verify cluster access
             try:
-                self.eks_client.describe_cluster(name=self.cluster_name)
+                await self._call(self.eks_client.describe_cluster, name=self.cluster_name)
                 logger.info("Successfully verified cluster access")
             except ClientError as e:
-                logger.error(f"Error accessing cluster: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
+                logger.error("Error accessing cluster: %s", e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
                 return False, f"Error accessing cluster: {str(e)}"
 
             # List nodegroups
             try:
-                response = self.eks_client.list_nodegroups(clusterName=self.cluster_name)
-                logger.info(f"Successfully retrieved nodegroups list")
-                logger.info(f"Found nodegroups: {response['nodegroups']}")
+                ng_names = await self._call(self._list_nodegroup_names)
+                logger.info("Successfully retrieved nodegroups list")
+                logger.info("Found nodegroups: %s", ng_names)
             except ClientError as e:
-                logger.error(f"Error listing nodegroups: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
+                logger.error("Error listing nodegroups: %s", e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
                 return False, f"Error listing nodegroups: {str(e)}"
 
-            nodegroups = []
-            for ng_name in response['nodegroups']:
-                try:
-                    logger.info(f"Getting details for nodegroup: {ng_name}")
-                    ng_info = self.eks_client.describe_nodegroup(
-                        clusterName=self.cluster_name,
-                        nodegroupName=ng_name
-                    )['nodegroup']
-                    
-                    # Get tags
+            sem = asyncio.Semaphore(self._max_parallel_requests)
+
+            async def describe(ng_name):
+                async with sem:
                     try:
-                        tags = self.eks_client.list_tags_for_resource(
-                            resourceArn=ng_info['nodegroupArn']
-                        )['tags']
-                        logger.info(f"Retrieved tags for nodegroup {ng_name}")
+                        logger.info("Getting details for nodegroup: %s", ng_name)
+                        ng_info = await self._describe_nodegroup_cached(ng_name)
+                        
+                        # Get tags
+                        try:
+                            tags = (await self._call_with_backoff(
+                                self.eks_client.list_tags_for_resource,
+                                resourceArn=ng_info['nodegroupArn']
+                            ))['tags']
+                            logger.info("Retrieved tags for nodegroup %s", ng_name)
+                        except ClientError as e:
+                            logger.warning("Error getting tags for nodegroup %s: %s", ng_name, e)
+                            tags = {}
+                        
+                        logger.info("Successfully processed nodegroup: %s", ng_name)
+                        return {
+                            'name': ng_name,
+                            'status': ng_info['status'],
+                            'size': ng_info['scalingConfig']['desiredSize'],
+                            'min_size': ng_info['scalingConfig']['minSize'],
+                            'max_size': ng_info['scalingConfig']['maxSize'],
+                            'tags': tags
+                        }
                     except ClientError as e:
-                        logger.warning(f"Error getting tags for nodegroup {ng_name}: {str(e)}")
-                        tags = {}
-                    
-                    nodegroups.append({
-                        'name': ng_name,
-                        'status': ng_info['status'],
-                        'size': ng_info['scalingConfig']['desiredSize'],
-                        'min_size': ng_info['scalingConfig']['minSize'],
-                        'max_size': ng_info['scalingConfig']['maxSize'],
-                        'tags': tags
-                    })
-                    logger.info(f"Successfully processed nodegroup: {ng_name}")
-                except ClientError as e:
-                    logger.error(f"Error getting details for nodegroup {ng_name}: {str(e)}")
-                    continue
+                        logger.error("Error getting details for nodegroup %s: %s", ng_name, e)
+                        return None
+
+            results = await asyncio.gather(*(describe(ng_name) for ng_name in ng_names))
+            nodegroups = [ng for ng in results if ng is not None]
             
+            # Don't cache a listing that a tag/scale/create invalidated while it was in flight
+            if self._cache_generation == generation:
+                self._nodegroups_cache, self._nodegroups_cache_ts = nodegroups, now
             return True, nodegroups
         except Exception as e:
-            logger.error(f"Unexpected error in list_nodegroups: {str(e)}")
+            logger.error("Unexpected error in list_nodegroups: %s", e)
             return False, str(e)
 
-    async def add_nodegroup_tags(self, nodegroup_name, tags):
+    async def replace_nodegroup_tags(self, nodegroup_name, add=None, remove=None):
         """
-        Add tags to a nodegroup
+        Add and/or remove nodegroup tags, resolving the ARN once and sending both requests concurrently
         
         Args:
             nodegroup_name (str): Name of the nodegroup
-            tags (dict): Dictionary of tag key-value pairs
+            add (dict): Tag key-value pairs to set
+            remove (list): Tag keys to remove
         """
         try:
-            logger.info(f"Attempting to add tags to nodegroup {nodegroup_name} in cluster {self.cluster_name}")
+            logger.info("Attempting to update tags on nodegroup %s in cluster %s", nodegroup_name, self.cluster_name)
             
             # Get nodegroup ARN
             try:
-                ng_info = self.eks_client.describe_nodegroup(
-                    clusterName=self.cluster_name,
-                    nodegroupName=nodegroup_name
-                )['nodegroup']
-                logger.info(f"Successfully retrieved nodegroup {nodegroup_name} details")
+                nodegroup_arn = await self._get_nodegroup_arn_cached(nodegroup_name)
+                logger.info("Successfully retrieved nodegroup %s details", nodegroup_name)
             except ClientError as e:
-                logger.error(f"Error getting nodegroup {nodegroup_name} details: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
+                logger.error("Error getting nodegroup %s details: %s", nodegroup_name, e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
                 return False, f"Error getting nodegroup {nodegroup_name} details: {str(e)}"
             
-            # Add tags
+            # Add and remove tags
+            calls = []
+            if add:
+                calls.append(self._call(self.eks_client.tag_resource, resourceArn=nodegroup_arn, tags=add))
+            if remove:
+                calls.append(self._call(self.eks_client.untag_resource, resourceArn=nodegroup_arn, tagKeys=remove))
             try:
-                self.eks_client.tag_resource(
-                    resourceArn=ng_info['nodegroupArn'],
-                    tags=tags
-                )
-                logger.info(f"Successfully added tags to nodegroup {nodegroup_name}")
+                await asyncio.gather(*calls)
+                logger.info("Successfully updated tags on nodegroup %s", nodegroup_name)
             except ClientError as e:
-                logger.error(f"Error adding tags to nodegroup {nodegroup_name}: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
-                return False, f"Error adding tags to nodegroup {nodegroup_name}: {str(e)}"
-            
-            return True, f"Successfully added tags to nodegroup {nodegroup_name}"
+                logger.error("Error updating tags on nodegroup %s: %s", nodegroup_name, e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
+                return False, f"Error updating tags on nodegroup {nodegroup_name}: {str(e)}"
+            finally:
+                self._invalidate_nodegroup_cache(nodegroup_name)
+            
+            return True, f"Successfully updated tags on nodegroup {nodegroup_name}"
         except Exception as e:
-            logger.error(f"Unexpected error in add_nodegroup_tags: {str(e)}")
+            logger.error("Unexpected error in replace_nodegroup_tags: %s", e)
             return False, str(e)
 
+    async def add_nodegroup_tags(self, nodegroup_name, tags):
+        """
+        Add tags to a nodegroup
+        
+        Args:
+            nodegroup_name (str): Name of the nodegroup
+            tags (dict): Dictionary of tag key-value pairs
+        """
+        success, message = await self.replace_nodegroup_tags(nodegroup_name, add=tags)
+        if not success:
+            return False, message
+        return True, f"Successfully added tags to nodegroup {nodegroup_name}"
+
     async def remove_nodegroup_tags(self, nodegroup_name, tag_keys):
         """
         Remove tags from a nodegroup
@@ -175,39 +540,10 @@ class EKSManager:
             nodegroup_name (str): Name of the nodegroup
             tag_keys (list): List of tag keys to remove
         """
-        try:
-            logger.info(f"Attempting to remove tags from nodegroup {nodegroup_name} in cluster {self.cluster_name}")
-            
-            # Get nodegroup ARN
-            try:
-                ng_info = self.eks_client.describe_nodegroup(
-                    clusterName=self.cluster_name,
-                    nodegroupName=nodegroup_name
-                )['nodegroup']
-                logger.info(f"Successfully retrieved nodegroup {nodegroup_name} details")
-            except ClientError as e:
-                logger.error(f"Error getting nodegroup {nodegroup_name} details: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
-                return False, f"Error getting nodegroup {nodegroup_name} details: {str(e)}"
-            
-            # Remove tags
-            try:
-                self.eks_client.untag_resource(
-                    resourceArn=ng_info['nodegroupArn'],
-                    tagKeys=tag_keys
-                )
-                logger.info(f"Successfully removed tags from nodegroup {nodegroup_name}")
-            except ClientError as e:
-                logger.error(f"Error removing tags from nodegroup {nodegroup_name}: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
-                return False, f"Error removing tags from nodegroup {nodegroup_name}: {str(e)}"
-            
-            return True, f"Successfully removed tags from nodegroup {nodegroup_name}"
-        except Exception as e:
-            logger.error(f"Unexpected error in remove_nodegroup_tags: {str(e)}")
-            return False, str(e)
+        success, message = await self.replace_nodegroup_tags(nodegroup_name, remove=tag_keys)
+        if not success:
+            return False, message
+        return True, f"Successfully removed tags from nodegroup {nodegroup_name}"
 
     async def scale_nodegroup(self, nodegroup_name, desired_size):
         """
@@ -218,19 +554,16 @@ class EKSManager:
             desired_size (int): Desired number of nodes
         """
         try:
-            logger.info(f"Attempting to scale nodegroup {nodegroup_name} to {desired_size} nodes in cluster {self.cluster_name}")
+            logger.info("Attempting to scale nodegroup %s to %s nodes in cluster %s", nodegroup_name, desired_size, self.cluster_name)
             
             # Get current nodegroup info
             try:
-                nodegroup = self.eks_client.describe_nodegroup(
-                    clusterName=self.cluster_name,
-                    nodegroupName=nodegroup_name
-                )['nodegroup']
-                logger.info(f"Successfully retrieved nodegroup {nodegroup_name} details")
+                nodegroup = await self._describe_nodegroup_cached(nodegroup_name)
+                logger.info("Successfully retrieved nodegroup %s details", nodegroup_name)
             except ClientError as e:
-                logger.error(f"Error getting nodegroup {nodegroup_name} details: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
+                logger.error("Error getting nodegroup %s details: %s", nodegroup_name, e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
                 return False, f"Error getting nodegroup {nodegroup_name} details: {str(e)}"
             
             current_size = nodegroup['scalingConfig']['desiredSize']
@@ -243,18 +576,20 @@ class EKSManager:
 
             # Update nodegroup
             try:
-                self.eks_client.update_nodegroup_config(
+                await self._call(
+                    self.eks_client.update_nodegroup_config,
                     clusterName=self.cluster_name,
                     nodegroupName=nodegroup_name,
                     scalingConfig={
                         'desiredSize': desired_size
                     }
                 )
-                logger.info(f"Successfully scaled nodegroup {nodegroup_name} to {desired_size} nodes")
+                logger.info("Successfully scaled nodegroup %s to %s nodes", nodegroup_name, desired_size)
+                self._invalidate_nodegroup_cache(nodegroup_name)
             except ClientError as e:
-                logger.error(f"Error scaling nodegroup {nodegroup_name}: {str(e)}")
-                logger.error(f"Error code: {e.response['Error']['Code']}")
-                logger.error(f"Error message: {e.response['Error']['Message']}")
+                logger.error("Error scaling nodegroup %s: %s", nodegroup_name, e)
+                logger.error("Error code: %s", e.response['Error']['Code'])
+                logger.error("Error message: %s", e.response['Error']['Message'])
                 return False, f"Error scaling nodegroup {nodegroup_name}: {str(e)}"
             
             return True, {
@@ -265,114 +600,168 @@ class EKSManager:
                 'max_size': max_size
             }
         except Exception as e:
-            logger.error(f"Unexpected error in scale_nodegroup: {str(e)}")
+            logger.error("Unexpected error in scale_nodegroup: %s", e)
             return False, str(e)
 
     async def get_nodegroup_status(self, nodegroup_name):
-        """Get the current status of a nodegroup"""
+        """Get the current status of a nodegroup, or None if it doesn't exist"""
         try:
-            logger.info(f"[STATUS] Checking nodegroup '{nodegroup_name}'...")
-            start_time = datetime.now()
-            
-            try:
-                logger.info(f"[STATUS] Calling describe_nodegroup API...")
-                response = self.eks_client.describe_nodegroup(
-                    clusterName=self.cluster_name,
-                    nodegroupName=nodegroup_name
-                )
-                end_time = datetime.now()
-                elapsed = (end_time - start_time).total_seconds()
-                logger.info(f"[STATUS] API call completed in {elapsed:.1f}s")
-                
-                nodegroup = response['nodegroup']
-                status = nodegroup.get('status')
-                
-                # Log detailed status information
-                logger.info(f"[STATUS] Current state: {status}")
-                if 'statusMessage' in nodegroup:
-                    logger.info(f"[STATUS] Status message: {nodegroup['statusMessage']}")
-                    
-                # Log health information
-                health = nodegroup.get('health', {})
-                logger.info(f"[STATUS] Health details:")
-                logger.info(f"[STATUS] - Issues: {json.dumps(health.get('issues', []), default=str)}")
-                
-                # Log scaling information
-                scaling = nodegroup.get('scalingConfig', {})
-                logger.info(f"[STATUS] Scaling details:")
-                logger.info(f"[STATUS] - Desired: {scaling.get('desiredSize')}")
-                logger.info(f"[STATUS] - Min: {scaling.get('minSize')}")
-                logger.info(f"[STATUS] - Max: {scaling.get('maxSize')}")
-                
-                # Log resources information
-                resources = nodegroup.get('resources', {})
-                logger.info(f"[STATUS] Resources:")
-                logger.info(f"[STATUS] - AutoScaling groups: {json.dumps(resources.get('autoScalingGroups', []), default=str)}")
-                logger.info(f"[STATUS] - Remote access config: {json.dumps(resources.get('remoteAccessConfig', {}), default=str)}")
-                
-                return status
-                
-            except self.eks_client.exceptions.ResourceNotFoundException:
-                logger.info(f"[STATUS] Nodegroup '{nodegroup_name}' not found")
-                return None
-                
-            except ClientError as e:
-                error_code = e.response['Error']['Code']
-                error_msg = e.response['Error']['Message']
-                request_id = e.response['ResponseMetadata'].get('RequestId', 'N/A')
-                logger.error(f"[STATUS] AWS error during status check:")
-                logger.error(f"[STATUS] Error Code: {error_code}")
-                logger.error(f"[STATUS] Error Message: {error_msg}")
-                logger.error(f"[STATUS] Request ID: {request_id}")
-                logger.error(f"[STATUS] Full error response: {json.dumps(e.response, default=str)}")
-                raise
+            start_time = time.monotonic()
+            status = await self._get_nodegroup_status_quiet(nodegroup_name)
+            logger.info("[STATUS] Nodegroup '%s' state: %s (%.1fs)", nodegroup_name, status, time.monotonic() - start_time)
+            return status
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_msg = e.response['Error']['Message']
+            request_id = e.response['ResponseMetadata'].get('RequestId', 'N/A')
+            logger.error("[STATUS] AWS error during status check:")
+            logger.error("[STATUS] Error Code: %s", error_code)
+            logger.error("[STATUS] Error Message: %s", error_msg)
+            logger.error("[STATUS] Request ID: %s", request_id)
+            logger.debug("[STATUS] Full error response: %s", e.response)
+            raise
                 
         except Exception as e:
-            logger.error(f"[STATUS] Unexpected error during status check: {str(e)}")
-            logger.error(f"[STATUS] Error type: {type(e).__name__}")
-            logger.error(f"[STATUS] Stack trace:", exc_info=True)
+            logger.error("[STATUS] Unexpected error during status check: %s", e)
+            logger.error("[STATUS] Error type: %s", type(e).__name__)
+            logger.error("[STATUS] Stack trace:", exc_info=True)
             raise
 
+    async def get_nodegroup_details(self, nodegroup_name):
+        """
+        Get status, scaling, tags and health of a nodegroup for display
+        
+        Returns:
+            tuple: (success: bool, details dict or error message)
+        """
+        try:
+            logger.info("[STATUS] Getting details for nodegroup '%s'...", nodegroup_name)
+            nodegroup = (await self._call(
+                self.eks_client.describe_nodegroup,
+                clusterName=self.cluster_name,
+                nodegroupName=nodegroup_name
+            ))['nodegroup']
+            status = nodegroup.get('status')
+            scaling = nodegroup.get('scalingConfig', {})
+            issues = nodegroup.get('health', {}).get('issues', [])
+
+            # Log detailed status information
+            logger.info("[STATUS] Current state: %s", status)
+            if 'statusMessage' in nodegroup:
+                logger.info("[STATUS] Status message: %s", nodegroup['statusMessage'])
+            logger.info("[STATUS] Scaling - Desired: %s, Min: %s, Max: %s", scaling.get('desiredSize'), scaling.get('minSize'), scaling.get('maxSize'))
+            if logger.isEnabledFor(logging.DEBUG):
+                resources = nodegroup.get('resources', {})
+                logger.debug("[STATUS] - Issues: %s", issues)
+                logger.debug("[STATUS] - AutoScaling groups: %s", resources.get('autoScalingGroups', []))
+                logger.debug("[STATUS] - Remote access config: %s", resources.get('remoteAccessConfig', {}))
+
+            return True, {
+                'nodegroup_name': nodegroup_name,
+                'cluster_name': self.cluster_name,
+                'status': status,
+                'current_size': scaling.get('desiredSize'),
+                'min_size': scaling.get('minSize'),
+                'max_size': scaling.get('maxSize'),
+                'tags': nodegroup.get('tags', {}),
+                'health': {issue.get('code'): issue.get('message') for issue in issues}
+            }
+        except ClientError as e:
+            logger.error("[STATUS] Error getting details for nodegroup %s: %s", nodegroup_name, e)
+            return False, str(e)
+        except Exception as e:
+            logger.error("[STATUS] Unexpected error getting nodegroup details: %s", e)
+            return False, str(e)
+
+    async def _get_nodegroup_status_quiet(self, nodegroup_name):
+        """Return only the nodegroup status (None if it doesn't exist), without the verbose status logging"""
+        try:
+            response = await self._call_with_backoff(
+                self.eks_client.describe_nodegroup,
+                clusterName=self.cluster_name,
+                nodegroupName=nodegroup_name
+            )
+        except self._resource_not_found:
+            return None
+        return response['nodegroup'].get('status')
+
+    async def _wait_for_desired_size(self, nodegroup_name, target_size, timeout):
+        """Poll until a nodegroup's desiredSize equals target_size; returns False if timeout passes first"""
+        deadline = time.monotonic() + timeout
+        delay = _DELETE_POLL_INITIAL_DELAY
+        while True:
+            self._ng_cache.invalidate(nodegroup_name)
+            nodegroup = await self._describe_nodegroup_cached(nodegroup_name)
+            if nodegroup.get('scalingConfig', {}).get('desiredSize') == target_size:
+                return True
+            if time.monotonic() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _DELETE_POLL_MAX_DELAY)
+
+    async def wait_for_nodegroup_status(self, nodegroup_name, target_status, timeout=_NODEGROUP_WAIT_TIMEOUT):
+        """
+        Poll a nodegroup until it reaches target_status, backing off exponentially between checks
+
+        Returns:
+            tuple: (success: bool, status or error message: str)
+        """
+        deadline = time.monotonic() + timeout
+        delay = _POLL_INITIAL_DELAY
+        try:
+            while True:
+                status = await self._get_nodegroup_status_quiet(nodegroup_name)
+                if status == target_status:
+                    return True, status
+                if status is None:
+                    return False, f"Nodegroup {nodegroup_name} no longer exists"
+                if status in _TERMINAL_FAILED_STATES:
+                    return False, f"Nodegroup entered failed state: {status}"
+                if time.monotonic() + delay > deadline:
+                    return False, f"Timeout waiting for nodegroup {nodegroup_name} to become {target_status} (last status: {status})"
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _POLL_MAX_DELAY)
+        except ClientError as e:
+            logger.error("Error waiting for nodegroup %s: %s", nodegroup_name, e)
+            return False, str(e)
+
     async def list_scalable_nodegroups(self):
         """List nodegroups that can be scaled with their current sizes and limits"""
         try:
-            logger.info(f"Listing scalable nodegroups in cluster {self.cluster_name}")
+            logger.info("Listing scalable nodegroups in cluster %s", self.cluster_name)
             
             # Get all nodegroups
             try:
-                response = self.eks_client.list_nodegroups(clusterName=self.cluster_name)
-                logger.info(f"Found nodegroups: {response['nodegroups']}")
+                ng_names = await self._call(self._list_nodegroup_names)
+                logger.info("Found nodegroups: %s", ng_names)
             except ClientError as e:
-                logger.error(f"Error listing nodegroups: {str(e)}")
+                logger.error("Error listing nodegroups: %s", e)
                 return False, f"Error listing nodegroups: {str(e)}"
 
             scalable_groups = []
-            for ng_name in response['nodegroups']:
-                try:
-                    ng_info = self.eks_client.describe_nodegroup(
-                        clusterName=self.cluster_name,
-                        nodegroupName=ng_name
-                    )['nodegroup']
-                    
-                    # Get scaling configuration
-                    scaling = {
-                        'name': ng_name,
-                        'current_size': ng_info['scalingConfig']['desiredSize'],
-                        'min_size': ng_info['scalingConfig']['minSize'],
-                        'max_size': ng_info['scalingConfig']['maxSize'],
-                        'instance_types': ng_info.get('instanceTypes', ['unknown']),
-                        'status': ng_info['status']
-                    }
-                    
-                    scalable_groups.append(scaling)
-                    logger.info(f"Added scaling info for nodegroup {ng_name}")
-                except ClientError as e:
-                    logger.error(f"Error getting nodegroup {ng_name} details: {str(e)}")
+            for ng_name, ng_info in zip(ng_names, await self.describe_many_nodegroups(ng_names)):
+                if isinstance(ng_info, ClientError):
+                    logger.error("Error getting nodegroup %s details: %s", ng_name, ng_info)
                     continue
+                if isinstance(ng_info, BaseException):
+                    raise ng_info
+
+                logger.info("Added scaling info for nodegroup %s", ng_name)
+                # Get scaling configuration
+                scalable_groups.append({
+                    'name': ng_name,
+                    'current_size': ng_info['scalingConfig']['desiredSize'],
+                    'min_size': ng_info['scalingConfig']['minSize'],
+                    'max_size': ng_info['scalingConfig']['maxSize'],
+                    'instance_types': ng_info.get('instanceTypes', ['unknown']),
+                    'status': ng_info['status']
+                })
             
             return True, scalable_groups
         except Exception as e:
-            logger.error(f"Unexpected error in list_scalable_nodegroups: {str(e)}")
+            logger.error("Unexpected error in list_scalable_nodegroups: %s", e)
             return False, str(e)
 
     async def create_nodegroup(self, nodegroup_name, instance_type, desired_size, min_size, max_size, tags=None, capacity_type='ON_DEMAND'):
@@ -390,21 +779,22 @@ class EKSManager:
         """
         try:
             # Log initial request details
-            logger.info(f"Creating nodegroup with following parameters:")
-            logger.info(f"Cluster: {self.cluster_name}")
-            logger.info(f"Nodegroup name: {nodegroup_name}")
-            logger.info(f"Instance type: {instance_type}")
-            logger.info(f"Capacity type: {capacity_type}")
-            logger.info(f"Sizes - Desired: {desired_size}, Min: {min_size}, Max: {max_size}")
+            logger.info("Creating nodegroup with following parameters:")
+            logger.info("Cluster: %s", self.cluster_name)
+            logger.info("Nodegroup name: %s", nodegroup_name)
+            logger.info("Instance type: %s", instance_type)
+            logger.info("Capacity type: %s", capacity_type)
+            logger.info("Sizes - Desired: %s, Min: %s, Max: %s", desired_size, min_size, max_size)
             
             # Log IAM role info
-            logger.info(f"Using IAM role ARN: {self.node_role_arn}")
+            await self._ensure_bootstrap()
+            logger.info("Using IAM role ARN: %s", self.node_role_arn)
             
             # Log subnets being used
-            logger.info(f"Using subnets: {self.subnets}")
+            logger.info("Using subnets: %s", self.subnets)
             
             # Validate capacity type
-            if capacity_type not in ['ON_DEMAND', 'SPOT']:
+            if capacity_type not in _VALID_CAPACITY_TYPES:
                 return False, "Capacity type must be either 'ON_DEMAND' or 'SPOT'"
             
             config = {
@@ -425,13 +815,15 @@ class EKSManager:
                 config['tags'] = tags
                 
             # Log the full configuration being sent
-            logger.info(f"Full nodegroup configuration: {json.dumps(config, indent=2)}")
+            logger.debug("Full nodegroup configuration: %s", LazyJson(config))
             
             try:
                 # Attempt to create nodegroup
                 logger.info("Calling EKS CreateNodegroup API...")
-                response = self.eks_client.create_nodegroup(**config)
-                logger.info(f"Successfully initiated nodegroup creation: {response}")
+                response = await self._call(self.eks_client.create_nodegroup, **config)
+                logger.info("Successfully initiated nodegroup creation, status: %s", response['nodegroup']['status'])
+                logger.debug("CreateNodegroup response: %s", LazyJson(response))
+                self._invalidate_nodegroup_cache(nodegroup_name)
                 
                 # Wait for creation to complete
                 success, message = await self.wait_for_nodegroup_status(nodegroup_name, 'ACTIVE')
@@ -445,20 +837,20 @@ class EKSManager:
                 error_msg = e.response['Error']['Message']
                 request_id = e.response.get('ResponseMetadata', {}).get('RequestId', 'N/A')
                 
-                logger.error(f"AWS API Error Details:")
-                logger.error(f"Error Code: {error_code}")
-                logger.error(f"Error Message: {error_msg}")
-                logger.error(f"Request ID: {request_id}")
-                logger.error(f"Full error response: {json.dumps(e.response, default=str)}")
+                logger.error("AWS API Error Details:")
+                logger.error("Error Code: %s", error_code)
+                logger.error("Error Message: %s", error_msg)
+                logger.error("Request ID: %s", request_id)
+                logger.debug("Full error response: %s", e.response)
                 
                 if error_code == 'AccessDeniedException':
                     logger.error("IAM Permission Issue Detected:")
-                    logger.error(f"Action: eks:CreateNodegroup")
+                    logger.error("Action: eks:CreateNodegroup")
                     account_id = self.get_account_id()
                     if account_id:
-                        logger.error(f"Resource: arn:aws:eks:{AWS_REGION}:{account_id}:cluster/{self.cluster_name}")
+                        logger.error("Resource: arn:aws:eks:%s:%s:cluster/%s", AWS_REGION, account_id, self.cluster_name)
                     else:
-                        logger.error(f"Resource: arn:aws:eks:{AWS_REGION}:*:cluster/{self.cluster_name}")
+                        logger.error("Resource: arn:aws:eks:%s:*:cluster/%s", AWS_REGION, self.cluster_name)
                     logger.error("Required IAM permissions:")
                     logger.error("- eks:CreateNodegroup")
                     logger.error("- iam:PassRole (for the node role)")
@@ -467,45 +859,23 @@ class EKSManager:
                 return False, f"Error creating nodegroup: {str(e)}"
                 
         except Exception as e:
-            logger.error(f"Unexpected error in create_nodegroup: {str(e)}")
+            logger.error("Unexpected error in create_nodegroup: %s", e)
             return False, f"Unexpected error: {str(e)}"
 
     async def create_performance_nodegroup(self, nodegroup_name, config=None, status_callback=None):
         """Create a performance nodegroup"""
         try:
             # Check if nodegroup already exists
-            status = await self.get_nodegroup_status(nodegroup_name)
+            status = await self._get_nodegroup_status_quiet(nodegroup_name)
             if status is not None:
                 msg = f"❌ Nodegroup '{nodegroup_name}' đã tồn tại (status: {status})"
                 logger.warning(msg)
                 return False, msg
 
-            logger.info(f"Creating performance nodegroup: {nodegroup_name}")
+            logger.info("Creating performance nodegroup: %s", nodegroup_name)
             
-            # Set default configuration
-            default_config = {
-                'ami_type': 'AL2023_x86_64_STANDARD',  # Latest Amazon Linux 2023
-                'instance_types': ['c7i.xlarge'],      # Latest compute-optimized instance
-                'min_size': 1,
-                'max_size': 1,
-                'desired_size': 1,
-                'capacity_type': 'ON_DEMAND',
-                'disk_size': 50,
-                'labels': {
-                    'component': 'performance-test'
-                },
-                'taints': [{
-                    'key': 'component',
-                    'value': 'performance-test',
-                    'effect': 'NO_SCHEDULE'
-                }]
-            }
-
-            # Update default config with any provided overrides
-            if config:
-                default_config.update(config)
-        
-            config = default_config
+            # Apply any provided overrides on top of the default configuration
+            config = {**_DEFAULT_PERF_CFG, **(config or {})}
 
             # Get cost estimates
             success, cost_data = await self.estimate_nodegroup_cost(
@@ -526,6 +896,7 @@ class EKSManager:
             })
 
             # Prepare EKS nodegroup configuration
+            await self._ensure_bootstrap()
             eks_config = {
                 'clusterName': self.cluster_name,
                 'nodegroupName': nodegroup_name,
@@ -550,36 +921,39 @@ class EKSManager:
 
             # Create the nodegroup
             try:
-                logger.info(f"Creating nodegroup with config: {json.dumps(eks_config, default=str)}")
-                response = self.eks_client.create_nodegroup(**eks_config)
-                logger.info(f"Create nodegroup response: {json.dumps(response, default=str)}")
+                logger.debug("Creating nodegroup with config: %s", eks_config)
+                response = await self._call(self.eks_client.create_nodegroup, **eks_config)
+                logger.info("Create nodegroup response: %s", response)
+                self._invalidate_nodegroup_cache(nodegroup_name)
             
                 if status_callback:
                     await status_callback("CREATING")
             
                 # Wait for nodegroup to become active with status updates
-                waiter = self.eks_client.get_waiter('nodegroup_active')
                 last_status = None
+                delay = _POLL_INITIAL_DELAY
             
                 try:
                     start_time = time.time()
-                    max_wait_time = 20 * 60  # 20 minutes timeout
+                    max_wait_time = _NODEGROUP_WAIT_TIMEOUT
                 
                     while True:
                         if time.time() - start_time > max_wait_time:
                             raise Exception("Timeout waiting for nodegroup to become active")
                     
                         try:
-                            current_status = await self.get_nodegroup_status(nodegroup_name)
+                            current_status = await self._get_nodegroup_status_quiet(nodegroup_name)
                             if current_status != last_status:
-                                logger.info(f"Nodegroup status changed: {current_status}")
+                                logger.info("Nodegroup status changed: %s", current_status)
                                 if status_callback:
                                     await status_callback(current_status)
                                 last_status = current_status
                             
                             if current_status == "ACTIVE":
                                 break
-                            elif current_status in ["CREATE_FAILED", "DELETE_FAILED", "DEGRADED"]:
+                            elif current_status is None:
+                                raise Exception("Nodegroup was unexpectedly deleted")
+                            elif current_status in _TERMINAL_FAILED_STATES:
                                 raise Exception(f"Nodegroup entered failed state: {current_status}")
                             
                         except ClientError as e:
@@ -587,10 +961,11 @@ class EKSManager:
                                 raise Exception("Nodegroup was unexpectedly deleted")
                             raise e
                         
-                        await asyncio.sleep(30)
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, _POLL_MAX_DELAY)
                     
                 except Exception as e:
-                    logger.error(f"Error waiting for nodegroup: {str(e)}")
+                    logger.error("Error waiting for nodegroup: %s", e)
                     if "timeout" in str(e).lower():
                         return False, f"⏳ Quá trình tạo nodegroup '{nodegroup_name}' đang mất nhiều thời gian hơn dự kiến. Vui lòng kiểm tra trạng thái sau."
                     return False, f"❌ Lỗi khi tạo nodegroup: {str(e)}"
@@ -598,9 +973,9 @@ class EKSManager:
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 error_msg = e.response['Error']['Message']
-                logger.error(f"AWS ClientError in create_nodegroup:")
-                logger.error(f"Error Code: {error_code}")
-                logger.error(f"Error Message: {error_msg}")
+                logger.error("AWS ClientError in create_nodegroup:")
+                logger.error("Error Code: %s", error_code)
+                logger.error("Error Message: %s", error_msg)
             
                 if error_code == 'ResourceInUseException':
                     return False, f"❌ Không thể tạo nodegroup '{nodegroup_name}' vì tên đã được sử dụng"
@@ -612,237 +987,277 @@ class EKSManager:
                     raise e
         
         except Exception as e:
-            logger.error(f"Unexpected error in create_performance_nodegroup: {str(e)}")
+            logger.error("Unexpected error in create_performance_nodegroup: %s", e)
             return False, f"❌ Lỗi không mong muốn: {str(e)}"
 
     async def delete_performance_nodegroup(self, nodegroup_name):
-        """Delete a performance nodegroup"""
+        """Delete a performance nodegroup, scaling it down to 0 first"""
+        return await self.delete_nodegroup(nodegroup_name, graceful=True)
+
+    async def delete_nodegroup(self, nodegroup_name, graceful=False):
+        """
+        Delete a nodegroup and wait until it is gone
+
+        Args:
+            nodegroup_name (str): Name of the nodegroup
+            graceful (bool): Scale the nodegroup down to 0 and wait before deleting it
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        # Every log line of this deletion, including those from worker threads, carries this ID
+        token = correlation_id.set(f"DELETE:{nodegroup_name}:{uuid.uuid4().hex[:6]}")
         try:
-            logger.info(f"[DELETE] ====== Starting deletion process ======")
-            logger.info(f"[DELETE] Nodegroup: {nodegroup_name}")
-            logger.info(f"[DELETE] Cluster: {self.cluster_name}")
-            logger.info(f"[DELETE] Region: {self.eks_client.meta.region_name}")
-            logger.info(f"[DELETE] Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            return await self._delete_nodegroup(nodegroup_name, graceful)
+        finally:
+            correlation_id.reset(token)
+
+    async def _delete_nodegroup(self, nodegroup_name, graceful):
+        """Body of delete_nodegroup; runs with the deletion's correlation ID set"""
+        try:
+            logger.info("====== Starting deletion process ======")
+            logger.info("Nodegroup: %s", nodegroup_name)
+            logger.info("Cluster: %s", self.cluster_name)
+            logger.info("Region: %s", self.eks_client.meta.region_name)
+            logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
             
             # Get current nodegroup status
             try:
-                logger.info(f"[DELETE] Step 1: Checking current nodegroup status...")
-                current_status = await self.get_nodegroup_status(nodegroup_name)
-                
-                if current_status is None:
-                    logger.warning(f"[DELETE] Nodegroup not found: {nodegroup_name}")
+                logger.info("Step 1: Checking current nodegroup status...")
+                # One describe serves both the status check and the detailed info below
+                try:
+                    nodegroup_info = await self._describe_nodegroup_cached(nodegroup_name)
+                except self._resource_not_found:
+                    logger.warning("Nodegroup not found: %s", nodegroup_name)
                     return False, f"❌ Không tìm thấy nodegroup '{nodegroup_name}'"
+                current_status = nodegroup_info.get('status')
                     
-                logger.info(f"[DELETE] Current status: {current_status}")
+                logger.info("Current status: %s", current_status)
                 
-                # Get detailed nodegroup info for debugging
+                # Log detailed nodegroup info for debugging
                 try:
-                    logger.info(f"[DELETE] Getting detailed nodegroup info...")
-                    nodegroup_info = self.eks_client.describe_nodegroup(
-                        clusterName=self.cluster_name,
-                        nodegroupName=nodegroup_name
-                    )['nodegroup']
-                    logger.info(f"[DELETE] Nodegroup details:")
-                    logger.info(f"[DELETE] - ARN: {nodegroup_info.get('nodegroupArn')}")
-                    logger.info(f"[DELETE] - Instance Types: {nodegroup_info.get('instanceTypes', [])}")
-                    logger.info(f"[DELETE] - Scaling Config: {json.dumps(nodegroup_info.get('scalingConfig', {}), default=str)}")
-                    logger.info(f"[DELETE] - Health: {json.dumps(nodegroup_info.get('health', {}), default=str)}")
-                    logger.info(f"[DELETE] - Resources: {json.dumps(nodegroup_info.get('resources', {}), default=str)}")
-                    logger.info(f"[DELETE] - Labels: {json.dumps(nodegroup_info.get('labels', {}), default=str)}")
-                    logger.info(f"[DELETE] - Tags: {json.dumps(nodegroup_info.get('tags', {}), default=str)}")
-                    logger.info(f"[DELETE] - Launch Template: {json.dumps(nodegroup_info.get('launchTemplate', {}), default=str)}")
-                    logger.info(f"[DELETE] - Status: {nodegroup_info.get('status')}")
+                    logger.info("Nodegroup details:")
+                    logger.info("- ARN: %s", nodegroup_info.get('nodegroupArn'))
+                    logger.info("- Instance Types: %s", nodegroup_info.get('instanceTypes', []))
+                    logger.info("- Scaling Config: %s", nodegroup_info.get('scalingConfig', {}))
+                    logger.info("- Health: %s", nodegroup_info.get('health', {}))
+                    logger.info("- Resources: %s", nodegroup_info.get('resources', {}))
+                    logger.info("- Labels: %s", nodegroup_info.get('labels', {}))
+                    logger.info("- Tags: %s", nodegroup_info.get('tags', {}))
+                    logger.info("- Launch Template: %s", nodegroup_info.get('launchTemplate', {}))
+                    logger.info("- Status: %s", nodegroup_info.get('status'))
                     if 'statusMessage' in nodegroup_info:
-                        logger.info(f"[DELETE] - Status Message: {nodegroup_info.get('statusMessage')}")
-                    logger.info(f"[DELETE] - Created At: {nodegroup_info.get('createdAt')}")
-                    logger.info(f"[DELETE] - Modified At: {nodegroup_info.get('modifiedAt')}")
+                        logger.info("- Status Message: %s", nodegroup_info.get('statusMessage'))
+                    logger.info("- Created At: %s", nodegroup_info.get('createdAt'))
+                    logger.info("- Modified At: %s", nodegroup_info.get('modifiedAt'))
                 except Exception as e:
-                    logger.warning(f"[DELETE] Could not get detailed nodegroup info: {str(e)}")
-                    logger.warning(f"[DELETE] Error type: {type(e).__name__}")
-                    logger.warning(f"[DELETE] Stack trace:", exc_info=True)
+                    logger.warning("Could not get detailed nodegroup info: %s", e)
+                    logger.warning("Error type: %s", type(e).__name__)
+                    logger.warning("Stack trace:", exc_info=True)
                 
                 # Check if already deleting
                 if current_status == "DELETING":
-                    logger.info(f"[DELETE] Nodegroup is already in DELETING state")
+                    logger.info("Nodegroup is already in DELETING state")
                     return True, f"⏳ Nodegroup '{nodegroup_name}' đang trong quá trình xóa"
                 
                 # Check for invalid states
-                invalid_states = ["CREATE_FAILED", "DELETE_FAILED", "DEGRADED"]
-                if current_status in invalid_states:
-                    logger.error(f"[DELETE] Cannot delete nodegroup in state: {current_status}")
+                if current_status in _TERMINAL_FAILED_STATES:
+                    logger.error("Cannot delete nodegroup in state: %s", current_status)
                     return False, f"❌ Không thể xóa nodegroup '{nodegroup_name}' do đang trong trạng thái {current_status}"
                 
-                # Step 2: Scale down the nodegroup first
-                logger.info(f"[DELETE] Step 2: Scaling down nodegroup...")
-                try:
-                    scaling_config = nodegroup_info.get('scalingConfig', {})
-                    current_size = scaling_config.get('desiredSize', 0)
-                    logger.info(f"[DELETE] Current scaling config:")
-                    logger.info(f"[DELETE] - Desired Size: {scaling_config.get('desiredSize')}")
-                    logger.info(f"[DELETE] - Min Size: {scaling_config.get('minSize')}")
-                    logger.info(f"[DELETE] - Max Size: {scaling_config.get('maxSize')}")
-                    
-                    if current_size > 0:
-                        logger.info(f"[DELETE] Scaling down from {current_size} to 0")
-                        update_response = self.eks_client.update_nodegroup_config(
-                            clusterName=self.cluster_name,
-                            nodegroupName=nodegroup_name,
-                            scalingConfig={
-                                'minSize': 0,
-                                'maxSize': scaling_config.get('maxSize', 1),
-                                'desiredSize': 0
-                            }
-                        )
-                        logger.info(f"[DELETE] Scale down response: {json.dumps(update_response, default=str)}")
-                        
-                        # Wait for scale down
-                        logger.info(f"[DELETE] Waiting 30 seconds for scale down...")
-                        await asyncio.sleep(30)
-                        
-                        # Verify scale down
-                        verify_info = self.eks_client.describe_nodegroup(
-                            clusterName=self.cluster_name,
-                            nodegroupName=nodegroup_name
-                        )['nodegroup']
-                        new_size = verify_info.get('scalingConfig', {}).get('desiredSize', -1)
-                        logger.info(f"[DELETE] New desired size after scale down: {new_size}")
-                    else:
-                        logger.info(f"[DELETE] No scale down needed, current size is already 0")
+                # Step 2: Optionally scale down first; DeleteNodegroup tears the nodes down itself
+                if not graceful:
+                    logger.info("Step 2: Skipping scale down (graceful=False)")
+                else:
+                    logger.info("Step 2: Scaling down nodegroup...")
+                    try:
+                        scaling_config = nodegroup_info.get('scalingConfig', {})
+                        current_size = scaling_config.get('desiredSize', 0)
+                        logger.info("Current scaling config:")
+                        logger.info("- Desired Size: %s", scaling_config.get('desiredSize'))
+                        logger.info("- Min Size: %s", scaling_config.get('minSize'))
+                        logger.info("- Max Size: %s", scaling_config.get('maxSize'))
                         
-                except Exception as e:
-                    logger.warning(f"[DELETE] Error during scale down: {str(e)}")
-                    logger.warning(f"[DELETE] Error type: {type(e).__name__}")
-                    logger.warning(f"[DELETE] Stack trace:", exc_info=True)
+                        if current_size > 0:
+                            logger.info("Scaling down from %s to 0", current_size)
+                            update_response = await self._call(
+                                self.eks_client.update_nodegroup_config,
+                                clusterName=self.cluster_name,
+                                nodegroupName=nodegroup_name,
+                                scalingConfig={
+                                    'minSize': 0,
+                                    'maxSize': scaling_config.get('maxSize', 1),
+                                    'desiredSize': 0
+                                }
+                            )
+                            logger.info("Scale down response: %s", update_response)
+                            self._invalidate_nodegroup_cache(nodegroup_name)
+                            
+                            # The update echoes the requested sizes, so no describe is needed to confirm them
+                            update = update_response.get('update', {})
+                            new_size = next(
+                                (param['value'] for param in update.get('params', []) if param.get('type') == 'DesiredSize'),
+                                None
+                            )
+                            logger.info("New desired size from update: %s", new_size)
+
+                            # Only wait when EKS actually accepted the scale-down update
+                            update_status = update.get('status')
+                            if update_status in ('InProgress', 'Successful'):
+                                logger.info("Waiting for scale down (up to %ss)...", _SCALE_DOWN_WAIT_TIMEOUT)
+                                reached = await self._wait_for_desired_size(nodegroup_name, 0, _SCALE_DOWN_WAIT_TIMEOUT)
+                                logger.info("Scale down %s", "reached desired size 0" if reached else "still in progress, deleting anyway")
+                            else:
+                                logger.warning("Scale down update not registered (status: %s), deleting directly", update_status)
+                        else:
+                            logger.info("No scale down needed, current size is already 0")
+                            
+                    except Exception as e:
+                        logger.warning("Error during scale down: %s", e)
+                        logger.warning("Error type: %s", type(e).__name__)
+                        logger.warning("Stack trace:", exc_info=True)
                 
                 # Step 3: Delete nodegroup
-                logger.info(f"[DELETE] Step 3: Sending delete request...")
-                logger.info(f"[DELETE] Time before delete request: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                response = self.eks_client.delete_nodegroup(
+                logger.info("Step 3: Sending delete request...")
+                logger.info("Time before delete request: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                response = await self._call(
+                    self.eks_client.delete_nodegroup,
                     clusterName=self.cluster_name,
                     nodegroupName=nodegroup_name
                 )
                 
+                self._invalidate_nodegroup_cache(nodegroup_name, deleted=True)
+                # The response already carries the DELETING nodegroup, so the first check needs no describe
+                if 'nodegroup' in response:
+                    self._ng_cache.set(nodegroup_name, response['nodegroup'])
+
                 # Log response details
-                logger.info(f"[DELETE] Delete request sent successfully")
-                logger.info(f"[DELETE] Time after delete request: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.info(f"[DELETE] Response metadata: {json.dumps(response.get('ResponseMetadata', {}), default=str)}")
-                logger.info(f"[DELETE] HTTP Status Code: {response.get('ResponseMetadata', {}).get('HTTPStatusCode')}")
-                logger.info(f"[DELETE] Request ID: {response.get('ResponseMetadata', {}).get('RequestId')}")
-                logger.info(f"[DELETE] Full response: {json.dumps(response, default=str)}")
+                logger.info("Delete request sent successfully")
+                logger.info("Time after delete request: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                logger.info("Response metadata: %s", response.get('ResponseMetadata', {}))
+                logger.info("HTTP Status Code: %s", response.get('ResponseMetadata', {}).get('HTTPStatusCode'))
+                logger.info("Request ID: %s", response.get('ResponseMetadata', {}).get('RequestId'))
+                logger.debug("Full response: %s", response)
                 
                 # Step 4: Monitor deletion progress
-                logger.info(f"[DELETE] Step 4: Monitoring deletion progress...")
-                max_retries = 30  # 5 minutes total (10 second intervals)
-                start_time = datetime.now()
+                logger.info("Step 4: Monitoring deletion progress...")
+                max_retries = 30  # ~6 minutes total once the delay reaches its cap
+                start_time = time.monotonic()
+                delay = _DELETE_POLL_INITIAL_DELAY
+                last_status = None
+                last_snapshot = None
                 for i in range(max_retries):
-                    current_time = datetime.now()
-                    elapsed = (current_time - start_time).total_seconds()
-                    logger.info(f"[DELETE] Check {i+1}/{max_retries} (Elapsed: {elapsed:.1f}s)")
+                    elapsed = time.monotonic() - start_time
+                    logger.info("Check %s/%s (Elapsed: %.1fs)", i+1, max_retries, elapsed)
                     
-                    verify_status = await self.get_nodegroup_status(nodegroup_name)
-                    logger.info(f"[DELETE] Status = {verify_status}")
-                    
-                    try:
-                        verify_info = self.eks_client.describe_nodegroup(
-                            clusterName=self.cluster_name,
-                            nodegroupName=nodegroup_name
-                        )['nodegroup']
-                        
-                        # Log more details about the nodegroup state
-                        logger.info(f"[DELETE] Detailed status at check {i+1}:")
-                        
-                        # Resources state
-                        resources = verify_info.get('resources', {})
-                        asg_groups = resources.get('autoScalingGroups', [])
-                        logger.info(f"[DELETE] - ASG Groups: {len(asg_groups)} groups")
-                        for asg in asg_groups:
-                            logger.info(f"[DELETE]   - Name: {asg.get('name')}")
-                        
-                        # Instance details
-                        logger.info(f"[DELETE] - Instance Types: {verify_info.get('instanceTypes', [])}")
-                        
-                        # Scaling details
-                        scaling = verify_info.get('scalingConfig', {})
-                        logger.info(f"[DELETE] - Current Scaling:")
-                        logger.info(f"[DELETE]   - Desired: {scaling.get('desiredSize')}")
-                        logger.info(f"[DELETE]   - Min: {scaling.get('minSize')}")
-                        logger.info(f"[DELETE]   - Max: {scaling.get('maxSize')}")
-                        
-                        # Health details
-                        health = verify_info.get('health', {})
-                        issues = health.get('issues', [])
-                        if issues:
-                            logger.info(f"[DELETE] - Health Issues Found: {len(issues)} issues")
-                            for issue in issues:
-                                logger.info(f"[DELETE]   - Code: {issue.get('code')}")
-                                logger.info(f"[DELETE]   - Message: {issue.get('message')}")
-                                logger.info(f"[DELETE]   - Resource IDs: {issue.get('resourceIds', [])}")
-                        else:
-                            logger.info(f"[DELETE] - No health issues reported")
+                    # While deletion is in progress a names-only list is enough to see the nodegroup disappear;
+                    # every few checks a full describe still catches DELETE_FAILED and logs the details
+                    if last_status == 'DELETING' and i % _DELETE_DESCRIBE_EVERY:
+                        listed = await self._call_with_backoff(self._list_nodegroup_names)
+                        verify_status = 'DELETING' if nodegroup_name in listed else None
+                        logger.info("Status = %s (from nodegroup list)", verify_status)
+                    else:
+                        try:
+                            verify_info = await self._describe_nodegroup_cached(nodegroup_name)
+                            verify_status = verify_info.get('status')
+                            logger.info("Status = %s", verify_status)
                         
-                        # Status message if any
-                        if 'statusMessage' in verify_info:
-                            logger.info(f"[DELETE] - Status Message: {verify_info['statusMessage']}")
-                            
-                        # Update info
-                        if 'updateConfig' in verify_info:
-                            logger.info(f"[DELETE] - Update Config: {json.dumps(verify_info['updateConfig'], default=str)}")
-                            
-                        # Taints if any
-                        if 'taints' in verify_info:
-                            logger.info(f"[DELETE] - Taints: {json.dumps(verify_info['taints'], default=str)}")
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                            logger.info(f"[DELETE] Nodegroup no longer exists")
-                        else:
-                            logger.warning(f"[DELETE] Error getting status details: {str(e)}")
-                            logger.warning(f"[DELETE] Error type: {type(e).__name__}")
-                            logger.warning(f"[DELETE] Full error: {json.dumps(e.response, default=str)}")
-                    
+                            resources = verify_info.get('resources', {})
+                            asg_groups = resources.get('autoScalingGroups', [])
+                            scaling = verify_info.get('scalingConfig', {})
+                            issues = verify_info.get('health', {}).get('issues', [])
+
+                            # Most ticks see no change; only log the details when the state actually moves
+                            snapshot = (verify_status, scaling.get('desiredSize'), len(asg_groups), len(issues))
+                            if snapshot != last_snapshot:
+                                last_snapshot = snapshot
+                                logger.info("Detailed status at check %s:", i+1)
+                                logger.info("- ASG Groups: %s groups", len(asg_groups))
+                                for asg in asg_groups:
+                                    logger.info("  - Name: %s", asg.get('name'))
+                                logger.info("- Instance Types: %s", verify_info.get('instanceTypes', []))
+                                logger.info("- Current Scaling:")
+                                logger.info("  - Desired: %s", scaling.get('desiredSize'))
+                                logger.info("  - Min: %s", scaling.get('minSize'))
+                                logger.info("  - Max: %s", scaling.get('maxSize'))
+                                if issues:
+                                    logger.info("- Health Issues Found: %s issues", len(issues))
+                                    for issue in issues:
+                                        logger.info("  - Code: %s", issue.get('code'))
+                                        logger.info("  - Message: %s", issue.get('message'))
+                                        logger.info("  - Resource IDs: %s", issue.get('resourceIds', []))
+                                else:
+                                    logger.info("- No health issues reported")
+                                if 'statusMessage' in verify_info:
+                                    logger.info("- Status Message: %s", verify_info['statusMessage'])
+
+                            # Serialized only if a handler actually emits the debug record
+                            if 'updateConfig' in verify_info:
+                                logger.debug("- Update Config: %s", LazyJson(verify_info['updateConfig']))
+                            if 'taints' in verify_info:
+                                logger.debug("- Taints: %s", LazyJson(verify_info['taints']))
+                        except self._resource_not_found:
+                            # A 404 from describe is the terminal signal: the nodegroup is gone
+                            verify_status = None
+                        except ClientError as e:
+                            logger.warning("Error getting status details: %s", e)
+                            logger.warning("Error type: %s", type(e).__name__)
+                            logger.debug("Full error: %s", e.response)
+                            raise
+
                     if verify_status is None:
-                        logger.info(f"[DELETE] Nodegroup successfully deleted")
-                        logger.info(f"[DELETE] Total time: {elapsed:.1f}s")
+                        elapsed = time.monotonic() - start_time
+                        logger.info("Nodegroup successfully deleted")
+                        logger.info("Total time: %.1fs", elapsed)
                         return True, f"✅ Đã xóa nodegroup '{nodegroup_name}' thành công"
-                        
+                    
                     if verify_status == "DELETE_FAILED":
-                        logger.error(f"[DELETE] Deletion failed")
-                        logger.error(f"[DELETE] Total time: {elapsed:.1f}s")
+                        logger.error("Deletion failed")
+                        logger.error("Total time: %.1fs", elapsed)
                         return False, f"❌ Xóa nodegroup '{nodegroup_name}' thất bại"
                         
                     if verify_status != "DELETING":
-                        logger.error(f"[DELETE] Unexpected status during deletion: {verify_status}")
-                        logger.error(f"[DELETE] Total time: {elapsed:.1f}s")
+                        logger.error("Unexpected status during deletion: %s", verify_status)
+                        logger.error("Total time: %.1fs", elapsed)
                         return False, f"❌ Trạng thái không mong muốn: {verify_status}"
                         
-                    await asyncio.sleep(10)
+                    # Drop this tick's entry so the next check's status and details come from one fresh describe
+                    self._ng_cache.invalidate(nodegroup_name)
+
+                    # Poll faster again whenever the status moves, otherwise back off with jitter
+                    if verify_status != last_status:
+                        delay = _DELETE_POLL_INITIAL_DELAY
+                        last_status = verify_status
+                    await asyncio.sleep(random.uniform(delay / 2, delay))
+                    delay = min(_DELETE_POLL_MAX_DELAY, delay * 1.5)
                 
-                logger.error(f"[DELETE] Deletion monitoring timed out after {elapsed:.1f}s")
+                logger.error("Deletion monitoring timed out after %.1fs", elapsed)
                 return False, f"❌ Quá thời gian chờ xóa nodegroup '{nodegroup_name}'"
                 
             except ClientError as e:
                 error_code = e.response['Error']['Code']
                 error_msg = e.response['Error']['Message']
                 request_id = e.response['ResponseMetadata'].get('RequestId', 'N/A')
-                logger.error(f"[DELETE] AWS error during deletion:")
-                logger.error(f"[DELETE] Error Code: {error_code}")
-                logger.error(f"[DELETE] Error Message: {error_msg}")
-                logger.error(f"[DELETE] Request ID: {request_id}")
-                logger.error(f"[DELETE] Full error response: {json.dumps(e.response, default=str)}")
+                logger.error("AWS error during deletion:")
+                logger.error("Error Code: %s", error_code)
+                logger.error("Error Message: %s", error_msg)
+                logger.error("Request ID: %s", request_id)
+                logger.debug("Full error response: %s", e.response)
                 
                 if error_code == 'ResourceInUseException':
-                    logger.error(f"[DELETE] Resources still using the nodegroup")
+                    logger.error("Resources still using the nodegroup")
                     return False, f"❌ Không thể xóa nodegroup '{nodegroup_name}' vì đang có resources đang sử dụng"
                 elif error_code == 'ResourceNotFoundException':
-                    logger.error(f"[DELETE] Nodegroup not found")
+                    logger.error("Nodegroup not found")
                     return False, f"❌ Không tìm thấy nodegroup '{nodegroup_name}'"
                 else:
-                    logger.error(f"[DELETE] Unexpected AWS error")
+                    logger.error("Unexpected AWS error")
                     return False, f"❌ Lỗi khi xóa nodegroup: {error_msg}"
                     
         except Exception as e:
-            logger.error(f"[DELETE] Unexpected error: {str(e)}")
-            logger.error(f"[DELETE] Error type: {type(e).__name__}")
-            logger.error(f"[DELETE] Stack trace:", exc_info=True)
+            logger.error("Unexpected error: %s", e)
+            logger.error("Error type: %s", type(e).__name__)
+            logger.error("Stack trace:", exc_info=True)
             return False, f"❌ Lỗi không mong muốn: {str(e)}"
 
     async def estimate_nodegroup_cost(self, instance_type, desired_size, capacity_type='ON_DEMAND'):
@@ -850,92 +1265,32 @@ class EKSManager:
         Estimate monthly cost for a nodegroup using AWS Pricing API
         """
         try:
-            # Initialize pricing client (only available in us-east-1)
-            pricing = boto3.client('pricing', region_name='us-east-1')
-            
-            # Map AWS regions to pricing API location names
-            region_map = {
-                'ap-southeast-1': 'Asia Pacific (Singapore)',
-                'us-east-1': 'US East (N. Virginia)',
-                'us-west-2': 'US West (Oregon)',
-                'ap-northeast-1': 'Asia Pacific (Tokyo)',
-                'eu-west-1': 'EU (Ireland)',
-                'eu-central-1': 'EU (Frankfurt)'
-            }
-            
-            location = region_map.get(AWS_REGION, 'Asia Pacific (Singapore)')
-            logger.info(f"Getting pricing for {instance_type} in {location}")
-            
-            # Query AWS Pricing API
-            filters = [
-                {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
-                {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
-                {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': location},
-                {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
-                {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'},
-                {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'}
-            ]
-            
-            response = pricing.get_products(
-                ServiceCode='AmazonEC2',
-                Filters=filters,
-                MaxResults=1
-            )
-            
-            if not response.get('PriceList'):
-                error_msg = f"No pricing found for {instance_type} in {location}"
-                logger.error(error_msg)
-                return False, error_msg
-            
-            # Parse pricing data
+            location = _PRICING_REGION_MAP.get(AWS_REGION, 'Asia Pacific (Singapore)')
+
             try:
-                price_data = json.loads(response['PriceList'][0])
-                on_demand_terms = price_data.get('terms', {}).get('OnDemand', {})
-                
-                if not on_demand_terms:
-                    error_msg = f"No OnDemand pricing terms found for {instance_type}"
-                    logger.error(error_msg)
-                    return False, error_msg
-                
-                # Get the first price dimension
-                first_offer = list(on_demand_terms.values())[0]
-                first_dimension = list(first_offer['priceDimensions'].values())[0]
-                on_demand_price = float(first_dimension['pricePerUnit']['USD'])
-                
-                if on_demand_price <= 0:
-                    error_msg = f"Invalid price (${on_demand_price}) found for {instance_type}"
-                    logger.error(error_msg)
-                    return False, error_msg
-                
-                logger.info(f"Found OnDemand price: ${on_demand_price}/hour")
-                
-                # Calculate hourly price based on capacity type
-                if capacity_type == 'SPOT':
-                    hourly_price = on_demand_price * 0.3  # Estimate 70% discount for SPOT
-                    logger.info(f"Calculated SPOT price (70% discount): ${hourly_price}/hour")
-                else:
-                    hourly_price = on_demand_price
-                
-                # Calculate monthly cost (30.44 days average per month)
-                monthly_cost = hourly_price * 24 * 30.44 * desired_size
-                
-                logger.info(f"Cost calculation results for {instance_type}:")
-                logger.info(f"• Hourly per node: ${hourly_price:.3f}")
-                logger.info(f"• Monthly total: ${monthly_cost:.2f}")
-                logger.info(f"• Capacity type: {capacity_type}")
-                logger.info(f"• Number of nodes: {desired_size}")
-                
-                return True, {
-                    'hourly_per_node': round(hourly_price, 3),
-                    'monthly_total': round(monthly_cost, 2),
-                    'instance_type': instance_type,
-                    'capacity_type': capacity_type
-                }
-                
-            except (KeyError, IndexError, ValueError) as e:
-                error_msg = f"Error parsing pricing data for {instance_type}: {str(e)}"
+                hourly_price = await asyncio.to_thread(_get_on_demand_price, instance_type, location)
+            except ValueError as e:
+                error_msg = str(e)
                 logger.error(error_msg)
                 return False, error_msg
+
+            if capacity_type == 'SPOT':
+                hourly_price *= _SPOT_PRICE_RATIO
+            
+            monthly_cost = hourly_price * _HOURS_PER_MONTH * desired_size
+            
+            logger.info("Cost calculation results for %s:", instance_type)
+            logger.info("• Hourly per node: $%.3f", hourly_price)
+            logger.info("• Monthly total: $%.2f", monthly_cost)
+            logger.info("• Capacity type: %s", capacity_type)
+            logger.info("• Number of nodes: %s", desired_size)
+            
+            return True, {
+                'hourly_per_node': round(hourly_price, 3),
+                'monthly_total': round(monthly_cost, 2),
+                'instance_type': instance_type,
+                'capacity_type': capacity_type
+            }
             
         except Exception as e:
             error_msg = f"Error getting pricing from AWS: {str(e)}"
@@ -945,14 +1300,15 @@ class EKSManager:
     async def compare_nodegroup_costs(self, instance_type, desired_size):
         """Compare costs between ON_DEMAND and SPOT for a nodegroup configuration"""
         try:
-            # Get costs for both types
             on_demand_success, on_demand_cost = await self.estimate_nodegroup_cost(instance_type, desired_size, 'ON_DEMAND')
             if not on_demand_success:
                 return False, on_demand_cost  # Return the error message
-                
-            spot_success, spot_cost = await self.estimate_nodegroup_cost(instance_type, desired_size, 'SPOT')
-            if not spot_success:
-                return False, spot_cost  # Return the error message
+
+            # SPOT is a fixed fraction of on-demand, so derive it locally instead of a second Pricing API lookup
+            spot_cost = {
+                'hourly_per_node': round(on_demand_cost['hourly_per_node'] * _SPOT_PRICE_RATIO, 3),
+                'monthly_total': round(on_demand_cost['monthly_total'] * _SPOT_PRICE_RATIO, 2)
+            }
                 
             savings = on_demand_cost['monthly_total'] - spot_cost['monthly_total']
             savings_percentage = (savings / on_demand_cost['monthly_total']) * 100 if on_demand_cost['monthly_total'] > 0 else 0
@@ -977,7 +1333,7 @@ class EKSManager:
             return True, self.format_bot_message(True, comparison)
             
         except Exception as e:
-            logger.error(f"Error comparing costs: {str(e)}", exc_info=True)
+            logger.error("Error comparing costs: %s", e, exc_info=True)
             return False, self.format_bot_message(False, str(e))
 
     def format_bot_message(self, success, data, nodegroup_name=None):
@@ -1018,46 +1374,13 @@ class EKSManager:
         try:
             logger.info("[Pod Creation] Starting performance test pod creation")
             
-            # Get cluster info for API server
-            logger.info("[Pod Creation] Getting cluster info")
-            cluster = self.eks_client.describe_cluster(name=self.cluster_name)
-            cluster_url = cluster['cluster']['endpoint']
-            cluster_ca = cluster['cluster']['certificateAuthority']['data']
-            logger.info(f"[Pod Creation] Cluster URL: {cluster_url}")
-            
-            # Get token
-            logger.info("[Pod Creation] Getting caller identity")
-            token_res = self.sts_client.get_caller_identity()
-            cluster_arn = cluster['cluster']['arn']
-            parts = cluster_arn.split(':')
-            region = parts[3]
-            account = parts[4]
-            logger.info(f"[Pod Creation] Account: {account}, Region: {region}")
-            logger.info(f"[Pod Creation] Caller Identity: {json.dumps(token_res, indent=2)}")
-            
-            # Configure client
-            logger.info("[Pod Creation] Configuring Kubernetes client")
-            configuration = client.Configuration()
-            configuration.host = cluster_url
-            configuration.verify_ssl = True
-            
-            # Write CA cert
-            logger.info("[Pod Creation] Writing CA certificate")
-            ca_file = self._write_ca_cert(cluster_ca)
-            configuration.ssl_ca_cert = ca_file
-            logger.info(f"[Pod Creation] CA cert written to: {ca_file}")
-            
             # Get bearer token
             logger.info("[Pod Creation] Getting bearer token")
-            bearer_token = self._get_bearer_token()
-            configuration.api_key = {"authorization": f"Bearer {bearer_token}"}
+            v1 = await self._get_core_v1_api()
+            bearer_token = await self._call(self._get_bearer_token)
+            self._k8s_configuration.api_key = {"authorization": f"Bearer {bearer_token}"}
             logger.info("[Pod Creation] Bearer token configured")
             
-            # Create API client
-            logger.info("[Pod Creation] Creating API client")
-            api_client = client.ApiClient(configuration)
-            v1 = client.CoreV1Api(api_client)
-            
             # Create pod manifest
             logger.info("[Pod Creation] Creating pod manifest")
             pod_manifest = {
@@ -1093,24 +1416,26 @@ class EKSManager:
                     }]
                 }
             }
-            logger.info(f"[Pod Creation] Pod manifest: {json.dumps(pod_manifest, indent=2)}")
+            logger.debug("[Pod Creation] Pod manifest: %s", LazyJson(pod_manifest))
             
             # Create pod
             logger.info("[Pod Creation] Creating pod in default namespace")
             try:
-                response = v1.create_namespaced_pod(
+                response = await asyncio.to_thread(
+                    v1.create_namespaced_pod,
                     body=pod_manifest,
                     namespace="default"
                 )
-                logger.info(f"[Pod Creation] Pod creation response: {response}")
+                logger.info("[Pod Creation] Created pod: %s", response.metadata.name)
+                logger.debug("[Pod Creation] Pod creation response: %s", response)
             except Exception as e:
-                logger.error(f"[Pod Creation] Pod creation failed: {str(e)}")
+                logger.error("[Pod Creation] Pod creation failed: %s", e)
                 if hasattr(e, 'body'):
-                    logger.error(f"[Pod Creation] Error body: {e.body}")
+                    logger.error("[Pod Creation] Error body: %s", e.body)
                 if hasattr(e, 'status'):
-                    logger.error(f"[Pod Creation] Error status: {e.status}")
+                    logger.error("[Pod Creation] Error status: %s", e.status)
                 if hasattr(e, 'reason'):
-                    logger.error(f"[Pod Creation] Error reason: {e.reason}")
+                    logger.error("[Pod Creation] Error reason: %s", e.reason)
                 raise e
             
             logger.info("[Pod Creation] Successfully created performance test pod")
@@ -1121,8 +1446,55 @@ class EKSManager:
             logger.error(error_msg)
             return False, error_msg
 
+    async def _get_core_v1_api(self):
+        """Return the Kubernetes CoreV1Api, building its configuration and API client on first use"""
+        if self._k8s_api is not None:
+            return self._k8s_api
+
+        # The kubernetes client is heavy to import and only needed here
+        from kubernetes import client
+
+        # Get cluster info for API server
+        logger.info("[Pod Creation] Getting cluster info")
+        cluster = await self._call(self.eks_client.describe_cluster, name=self.cluster_name)
+        cluster_url = cluster['cluster']['endpoint']
+        cluster_ca = cluster['cluster']['certificateAuthority']['data']
+        logger.info("[Pod Creation] Cluster URL: %s", cluster_url)
+        
+        # Get token
+        logger.info("[Pod Creation] Getting caller identity")
+        token_res = await self._call(self.sts_client.get_caller_identity)
+        cluster_arn = cluster['cluster']['arn']
+        parts = cluster_arn.split(':')
+        region = parts[3]
+        account = parts[4]
+        logger.info("[Pod Creation] Account: %s, Region: %s", account, region)
+        logger.debug("[Pod Creation] Caller Identity: %s", LazyJson(token_res))
+        
+        # Configure client
+        logger.info("[Pod Creation] Configuring Kubernetes client")
+        configuration = client.Configuration()
+        configuration.host = cluster_url
+        configuration.verify_ssl = True
+        
+        # Write CA cert
+        logger.info("[Pod Creation] Writing CA certificate")
+        ca_file = await asyncio.to_thread(self._write_ca_cert, cluster_ca)
+        configuration.ssl_ca_cert = ca_file
+        logger.info("[Pod Creation] CA cert written to: %s", ca_file)
+        
+        # Create API client; reusing it keeps the urllib3 pool and its TLS sessions alive
+        logger.info("[Pod Creation] Creating API client")
+        api_client = await asyncio.to_thread(client.ApiClient, configuration)
+        self._k8s_configuration = configuration
+        self._k8s_api = client.CoreV1Api(api_client)
+        return self._k8s_api
+
     def _get_bearer_token(self):
-        """Get bearer token for EKS authentication"""
+        """Get bearer token for EKS authentication, reusing the cached one while it is still valid"""
+        if self._bearer_token is not None and time.monotonic() < self._bearer_token_expires_at:
+            return self._bearer_token
+
         logger.info("[Bearer Token] Generating bearer token")
         try:
             # Get token using the EKS get_token method
@@ -1131,110 +1503,110 @@ class EKSManager:
             )
             logger.info("[Bearer Token] Successfully got token from EKS")
             
-            return token['token']
+            self._bearer_token = token['token']
+            self._bearer_token_expires_at = time.monotonic() + _BEARER_TOKEN_TTL
+            return self._bearer_token
             
         except Exception as e:
-            logger.error(f"[Bearer Token] Error generating token: {str(e)}")
+            logger.error("[Bearer Token] Error generating token: %s", e)
             raise e
 
     def _write_ca_cert(self, ca_data):
-        """Write cluster CA cert to temp file"""
-        import base64
-        import tempfile
+        """Write cluster CA cert to temp file once; later calls reuse the same file"""
+        if self._ca_cert_path is not None and os.path.exists(self._ca_cert_path):
+            return self._ca_cert_path
         
         logger.info("[CA Cert] Writing cluster CA certificate")
         try:
             # Decode base64 CA cert
             ca_cert = base64.b64decode(ca_data)
-            logger.info(f"[CA Cert] Decoded cert length: {len(ca_cert)} bytes")
+            logger.info("[CA Cert] Decoded cert length: %s bytes", len(ca_cert))
             
             # Write to temp file
             with tempfile.NamedTemporaryFile(delete=False) as temp:
                 temp.write(ca_cert)
-                logger.info(f"[CA Cert] Written to temp file: {temp.name}")
-                return temp.name
+                logger.info("[CA Cert] Written to temp file: %s", temp.name)
+            self._ca_cert_path = temp.name
+            atexit.register(_remove_file, temp.name)
+            return temp.name
         except Exception as e:
-            logger.error(f"[CA Cert] Error writing cert: {str(e)}")
+            logger.error("[CA Cert] Error writing cert: %s", e)
             raise e
 
     async def add_tags_to_nodegroup(self, nodegroup_name, tags):
         """Add tags to an existing nodegroup"""
         try:
-            logger.info(f"Adding tags to nodegroup {nodegroup_name}: {tags}")
+            logger.info("Adding tags to nodegroup %s: %s", nodegroup_name, tags)
             arn = await self.get_nodegroup_arn(nodegroup_name)
             if not arn:
                 return False, "Could not find nodegroup ARN"
             
-            self.eks_client.tag_resource(
+            await self._call(
+                self.eks_client.tag_resource,
                 resourceArn=arn,
                 tags=tags
             )
+            self._invalidate_nodegroup_cache(nodegroup_name)
             return True, "Tags added successfully"
         except Exception as e:
-            logger.error(f"Error adding tags to nodegroup: {str(e)}")
+            logger.error("Error adding tags to nodegroup: %s", e)
             return False, str(e)
             
     async def get_nodegroup_arn(self, nodegroup_name):
         """Get the ARN of a nodegroup"""
         try:
-            response = self.eks_client.describe_nodegroup(
-                clusterName=self.cluster_name,
-                nodegroupName=nodegroup_name
-            )
-            return response['nodegroup']['nodegroupArn']
+            return await self._get_nodegroup_arn_cached(nodegroup_name)
         except Exception as e:
-            logger.error(f"Error getting nodegroup ARN: {str(e)}")
+            logger.error("Error getting nodegroup ARN: %s", e)
             return None
 
     async def get_nodegroup_info(self, nodegroup_name):
         """Get detailed information about a nodegroup"""
         try:
-            logger.info(f"[INFO] Entering get_nodegroup_info with nodegroup_name: {nodegroup_name}")
+            logger.info("[INFO] Entering get_nodegroup_info with nodegroup_name: %s", nodegroup_name)
             
-            response = self.eks_client.describe_nodegroup(
+            response = await self._call(
+                self.eks_client.describe_nodegroup,
                 clusterName=self.cluster_name,
                 nodegroupName=nodegroup_name
             )
             
-            logger.debug(f"[DEBUG] Full response from describe_nodegroup: {json.dumps(response, default=str)}")
+            logger.debug("[DEBUG] Full response from describe_nodegroup: %s", LazyJson(response))
             
             if 'nodegroup' in response:
                 nodegroup = response['nodegroup']
-                logger.info(f"[INFO] Successfully got nodegroup info: {json.dumps(nodegroup, default=str)}")
+                logger.info("[INFO] Successfully got nodegroup info: %s", LazyJson(nodegroup))
                 return nodegroup
             
-            logger.warning(f"[INFO] No nodegroup data found in response: {json.dumps(response, default=str)}")
+            logger.warning("[INFO] No nodegroup data found in response: %s", LazyJson(response))
             return None
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_msg = e.response['Error']['Message']
-            logger.error(f"[INFO] AWS ClientError in get_nodegroup_info:")
-            logger.error(f"[INFO] Error Code: {error_code}")
-            logger.error(f"[INFO] Error Message: {error_msg}")
+            logger.error("[INFO] AWS ClientError in get_nodegroup_info:")
+            logger.error("[INFO] Error Code: %s", error_code)
+            logger.error("[INFO] Error Message: %s", error_msg)
             
             if error_code == 'ResourceNotFoundException':
-                logger.warning(f"[INFO] Nodegroup '{nodegroup_name}' not found")
+                logger.warning("[INFO] Nodegroup '%s' not found", nodegroup_name)
                 return None
                 
             raise e
             
         except Exception as e:
-            logger.error(f"[INFO] Error getting nodegroup info: {str(e)}")
+            logger.error("[INFO] Error getting nodegroup info: %s", e)
             return None
         
-        logger.info(f"[INFO] Exiting get_nodegroup_info")
+        logger.info("[INFO] Exiting get_nodegroup_info")
 
-    def get_nodegroup_running_time(self, nodegroup_name):
+    async def get_nodegroup_running_time(self, nodegroup_name):
         """Get the running time of a nodegroup in hours"""
         try:
-            response = self.eks_client.describe_nodegroup(
-                clusterName=self.cluster_name,
-                nodegroupName=nodegroup_name
-            )
+            nodegroup = await self._describe_nodegroup_cached(nodegroup_name)
             
             # Get creation time of the nodegroup
-            creation_time = response['nodegroup']['createdAt']
+            creation_time = nodegroup['createdAt']
             current_time = datetime.now(timezone.utc)
             running_time = current_time - creation_time
             
@@ -1242,21 +1614,18 @@ class EKSManager:
             return running_time.total_seconds() / 3600
             
         except Exception as e:
-            logger.error(f"Error getting nodegroup running time: {str(e)}")
+            logger.error("Error getting nodegroup running time: %s", e)
             return None
 
-    def is_performance_nodegroup(self, nodegroup_name):
+    async def is_performance_nodegroup(self, nodegroup_name):
         """Check if a nodegroup is a performance nodegroup based on its tags"""
         try:
-            response = self.eks_client.describe_nodegroup(
-                clusterName=self.cluster_name,
-                nodegroupName=nodegroup_name
-            )
+            nodegroup = await self._describe_nodegroup_cached(nodegroup_name)
             
             # Check tags
-            tags = response['nodegroup'].get('tags', {})
+            tags = nodegroup.get('tags', {})
             return tags.get('component') == 'performance-test'
             
         except Exception as e:
-            logger.error(f"Error checking performance nodegroup: {str(e)}")
+            logger.error("Error checking performance nodegroup: %s", e)
             return False
\ No newline at end of file
@@ -6,51 +6,165 @@ Provides functionality to manage RDS instances including:
 - Get instance metrics
 """
 
+import asyncio
 import boto3
+from botocore.config import Config
 import os
 import datetime
 import json
+import time
 from ..utils.logger import get_logger
+from ..utils.helpers import RequestBatcher, TTLCache, json_loads
+from ._rds_memory_table import INSTANCE_MEMORY_GB
 from ..config import (
     AWS_ACCESS_KEY_ID,
     AWS_SECRET_ACCESS_KEY,
-    AWS_REGION
+    AWS_REGION,
+    RDS_DESCRIBE_BATCH_WINDOW_MS,
+    RDS_MEMORY_CACHE_FILE
 )
 
 logger = get_logger(__name__)
 
+# Shared by every client: keep-alive pooled connections and adaptive retries on throttling
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=20,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Per-instance DescribeDBInstances results are reused this long (seconds); kept short so state polling stays fresh
+_DESCRIBE_CACHE_TTL = 5
+# The full instance list is reused this long (seconds)
+_LIST_CACHE_TTL = 60
+# Instance IDs sent in one filtered DescribeDBInstances request
+_DESCRIBE_BATCH_SIZE = 20
+# Instance class -> memory barely ever changes; cached lookups stay valid for 30 days
+_MEMORY_CACHE_TTL = 30 * 24 * 60 * 60
+_BYTES_PER_GB = 1 << 30
+
+
+def _format_free_memory(value, total_memory_gb):
+    """Format FreeableMemory bytes as free/total GB with the used percentage"""
+    if not total_memory_gb:
+        # Instance memory unknown: report free memory alone
+        return f"{value / _BYTES_PER_GB:.1f} GB free"
+    total_memory = total_memory_gb * _BYTES_PER_GB
+    memory_usage_percent = (total_memory - value) / total_memory * 100
+    return f"{value / _BYTES_PER_GB:.1f}/{total_memory_gb:.1f} GB ({memory_usage_percent:.1f}% used)"
+
+
+# Metrics reported by get_instance_metrics: display name -> CloudWatch metric and a
+# formatter taking (latest value, instance memory in GB)
+_RDS_METRICS = {
+    'CPU': {'MetricName': 'CPUUtilization', 'format': lambda v, mem_gb: f"{v:.1f}%"},
+    'Memory': {'MetricName': 'FreeableMemory', 'format': _format_free_memory},
+    'Storage': {'MetricName': 'FreeStorageSpace', 'format': lambda v, mem_gb: f"{v / _BYTES_PER_GB:.2f} GB"},
+    'IOPS': {'MetricName': 'ReadIOPS', 'format': lambda v, mem_gb: f"{v:.1f}/s"},
+    'Connections': {'MetricName': 'DatabaseConnections', 'format': lambda v, mem_gb: f"{v:.1f}"}
+}
+
 class RDSInstanceTypeInfo:
     """Handles RDS instance type information retrieval and caching."""
     
-    def __init__(self, region=AWS_REGION):
+    def __init__(self, region=AWS_REGION, cache_file=RDS_MEMORY_CACHE_FILE):
         """
         Initialize RDS instance type info manager.
         
         Args:
             region (str): AWS region name. Defaults to AWS_REGION from config.
+            cache_file (str): JSON file that persists memory lookups across restarts.
         """
         # Pricing API only available in us-east-1
-        self.pricing_client = boto3.client('pricing', region_name='us-east-1')
+        self.pricing_client = boto3.client('pricing', region_name='us-east-1', config=_CLIENT_CONFIG)
         self.region = region
-        self._instance_memory_cache = {}
-        self._cache_expiry = None
-        self._cache_duration = datetime.timedelta(days=1)
+        self._cache_file = cache_file
+        # instance_class -> (memory_gb, expires_at as a Unix timestamp, so it survives restarts)
+        self._instance_memory_cache = self._load_cache()
+        # Bulk Pricing fetch for the region, started on the first cache miss and shared by concurrent callers
+        self._preload_task = None
 
-    def _is_cache_valid(self):
+    def _load_cache(self):
         """
-        Check if the memory cache is still valid.
+        Read unexpired memory lookups from the cache file.
         
         Returns:
-            bool: True if cache is valid, False otherwise.
+            dict: instance_class -> (memory_gb, expires_at); empty if the file is missing or unreadable.
         """
-        return (self._cache_expiry is not None and 
-                datetime.datetime.now() < self._cache_expiry and 
-                self._instance_memory_cache)
+        try:
+            with open(self._cache_file) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {
+            instance_class: (memory_gb, expires_at)
+            for instance_class, (memory_gb, expires_at) in entries.items()
+            if expires_at > now
+        }
+
+    def _save_cache(self):
+        """Write the memory lookups to the cache file, replacing it atomically"""
+        tmp_file = f"{self._cache_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(self._instance_memory_cache, f)
+            os.replace(tmp_file, self._cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write RDS memory cache: {str(e)}")
+
+    def _preload_region(self):
+        """
+        Fetch memory for every RDS instance class in the region with one paginated Pricing query,
+        store it in the memory cache and persist it.
+        """
+        paginator = self.pricing_client.get_paginator('get_products')
+        pages = paginator.paginate(
+            ServiceCode='AmazonRDS',
+            Filters=[
+                {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': 'Asia Pacific (Singapore)'},
+                {'Type': 'TERM_MATCH', 'Field': 'productFamily', 'Value': 'Database Instance'}
+            ]
+        )
+        memory = {}
+        for page in pages:
+            for price in page['PriceList']:
+                # Entries without a memory attribute can be skipped without decoding them
+                if '"memory"' not in price:
+                    continue
+                attributes = json_loads(price)['product']['attributes']
+                instance_class = attributes.get('instanceType')
+                if not instance_class or 'memory' not in attributes or instance_class in memory:
+                    continue
+                try:
+                    # Memory comes in format like "2 GiB" or "1,024 GiB"
+                    memory[instance_class] = float(attributes['memory'].split()[0].replace(',', ''))
+                except (ValueError, IndexError):
+                    # One malformed entry (e.g. "NA") must not abort the whole region
+                    continue
+
+        expires_at = time.time() + _MEMORY_CACHE_TTL
+        self._instance_memory_cache.update(
+            (instance_class, (memory_gb, expires_at)) for instance_class, memory_gb in memory.items()
+        )
+        logger.info(f"Preloaded memory info for {len(memory)} RDS instance classes")
+        self._save_cache()
+
+    async def _ensure_preloaded(self):
+        """Run _preload_region once; a failed preload is retried on the next miss"""
+        if self._preload_task is None:
+            self._preload_task = asyncio.ensure_future(asyncio.to_thread(self._preload_region))
+        try:
+            # shield so one caller giving up doesn't cancel the preload for the others
+            await asyncio.shield(self._preload_task)
+        except Exception:
+            self._preload_task = None
+            raise
 
     async def get_instance_memory(self, instance_class):
         """
         Get memory (in GB) for an RDS instance class.
-        Uses AWS Pricing API with local caching.
+        Uses the generated INSTANCE_MEMORY_GB table, falling back to a region-wide AWS Pricing API preload with local caching.
         
         Args:
             instance_class (str): RDS instance class (e.g., 'db.t4g.micro')
@@ -58,43 +172,26 @@ class RDSInstanceTypeInfo:
         Returns:
             float: Memory in GB, or None if information cannot be retrieved
         """
+        # Known classes come from the generated table, no network needed
+        memory_gb = INSTANCE_MEMORY_GB.get(instance_class)
+        if memory_gb is not None:
+            return memory_gb
+
         try:
             # Check cache first
-            if self._is_cache_valid() and instance_class in self._instance_memory_cache:
-                return self._instance_memory_cache[instance_class]
-
-            # If cache invalid or instance not in cache, query AWS Pricing API
-            response = self.pricing_client.get_products(
-                ServiceCode='AmazonRDS',
-                Filters=[
-                    {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_class},
-                    {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': 'Asia Pacific (Singapore)'}
-                ]
-            )
+            entry = self._instance_memory_cache.get(instance_class)
+            if entry is not None and entry[1] > time.time():
+                return entry[0]
+            # An expired entry means the last preload is stale; allow a fresh one
+            if entry is not None and self._preload_task is not None and self._preload_task.done():
+                self._preload_task = None
 
-            for price in response['PriceList']:
-                attributes = json.loads(price)['product']['attributes']
-                if 'memory' in attributes:
-                    # Memory comes in format like "2 GiB"
-                    memory_str = attributes['memory']
-                    memory_gb = float(memory_str.split()[0])
-                    self._instance_memory_cache[instance_class] = memory_gb
-                    self._cache_expiry = datetime.datetime.now() + self._cache_duration
-                    return memory_gb
-
-            # Fallback to common instance types if API fails
-            fallback_memory = {
-                'db.t4g.micro': 1,
-                'db.t4g.small': 2,
-                'db.t4g.medium': 4,
-                'db.t4g.large': 8,
-                'db.t4g.xlarge': 16,
-                'db.t4g.2xlarge': 32
-            }
-            
-            if instance_class in fallback_memory:
-                self._instance_memory_cache[instance_class] = fallback_memory[instance_class]
-                return fallback_memory[instance_class]
+            # On a miss, fill the cache for the whole region in one pass instead of querying this class alone
+            if self._preload_task is None or not self._preload_task.done():
+                await self._ensure_preloaded()
+                entry = self._instance_memory_cache.get(instance_class)
+                if entry is not None:
+                    return entry[0]
 
             logger.warning(f"Could not find memory info for instance class: {instance_class}")
             return None
@@ -111,8 +208,8 @@ class RDSManager:
         try:
             # First try to create client without credentials (will use IAM role if available)
             logger.info("Attempting to initialize AWS clients using IAM role...")
-            self.rds_client = boto3.client('rds', region_name=AWS_REGION)
-            self.cloudwatch = boto3.client('cloudwatch', region_name=AWS_REGION)
+            self.rds_client = boto3.client('rds', region_name=AWS_REGION, config=_CLIENT_CONFIG)
+            self.cloudwatch = boto3.client('cloudwatch', region_name=AWS_REGION, config=_CLIENT_CONFIG)
             
             # Test the connection by making a simple API call
             self.rds_client.describe_db_instances(MaxRecords=5)
@@ -129,15 +226,69 @@ class RDSManager:
             self.rds_client = boto3.client('rds',
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name=AWS_REGION
+                region_name=AWS_REGION,
+                config=_CLIENT_CONFIG
             )
             self.cloudwatch = boto3.client('cloudwatch',
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                region_name=AWS_REGION
+                region_name=AWS_REGION,
+                config=_CLIENT_CONFIG
             )
             logger.info("Successfully initialized AWS clients using access keys")
         self.instance_info = RDSInstanceTypeInfo()
+        self._describe_cache = TTLCache(_DESCRIBE_CACHE_TTL, maxsize=256)
+        self._list_cache = TTLCache(_LIST_CACHE_TTL, maxsize=1)
+        # Single-instance lookups from concurrent callers are merged into one DescribeDBInstances call
+        self._describe_batcher = RequestBatcher(
+            self._describe_instances_by_id,
+            window=RDS_DESCRIBE_BATCH_WINDOW_MS / 1000,
+            max_batch=_DESCRIBE_BATCH_SIZE
+        )
+
+    def _describe_db_instances_filtered(self, db_instance_ids):
+        """Describe the given instances with one filtered, paginated DescribeDBInstances request"""
+        paginator = self.rds_client.get_paginator('describe_db_instances')
+        pages = paginator.paginate(Filters=[{'Name': 'db-instance-id', 'Values': db_instance_ids}])
+        return [instance for page in pages for instance in page['DBInstances']]
+
+    def _describe_all_db_instances(self):
+        """Describe every RDS instance in the region, following pagination"""
+        paginator = self.rds_client.get_paginator('describe_db_instances')
+        pages = paginator.paginate(PaginationConfig={'PageSize': 100})
+        return [instance for page in pages for instance in page['DBInstances']]
+
+    async def _describe_instances_by_id(self, db_instance_ids):
+        """
+        Describe many instances with as few DescribeDBInstances calls as possible.
+        
+        Returns:
+            dict: db_instance_id -> instance description (missing IDs are left out)
+        """
+        instances = {}
+        for i in range(0, len(db_instance_ids), _DESCRIBE_BATCH_SIZE):
+            chunk = db_instance_ids[i:i + _DESCRIBE_BATCH_SIZE]
+            for instance in await asyncio.to_thread(self._describe_db_instances_filtered, chunk):
+                instances[instance['DBInstanceIdentifier']] = instance
+        return instances
+
+    async def _describe(self, db_instance_id: str) -> dict:
+        """
+        Describe one RDS instance, reusing a result younger than _DESCRIBE_CACHE_TTL.
+        
+        Args:
+            db_instance_id (str): RDS instance identifier
+            
+        Returns:
+            dict: The DBInstances entry for the instance
+        """
+        instance = self._describe_cache.get(db_instance_id)
+        if instance is None:
+            instance = await self._describe_batcher.get(db_instance_id)
+            if instance is None:
+                raise LookupError(f"DBInstance {db_instance_id} not found")
+            self._describe_cache.set(db_instance_id, instance)
+        return instance
 
     async def _is_read_replica(self, db_instance_id: str) -> bool:
         """
@@ -150,8 +301,7 @@ class RDSManager:
             bool: True if instance is a read replica, False otherwise
         """
         try:
-            response = self.rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-            instance = response['DBInstances'][0]
+            instance = await self._describe(db_instance_id)
             return 'ReadReplicaSourceDBInstanceIdentifier' in instance
         except Exception as e:
             logger.error(f"Error checking if instance is read replica: {str(e)}")
@@ -172,7 +322,9 @@ class RDSManager:
             if await self._is_read_replica(db_instance_id):
                 return False, f"Không thể start/stop read replica instance. Vui lòng thao tác trên primary instance."
 
-            response = self.rds_client.start_db_instance(DBInstanceIdentifier=db_instance_id)
+            response = await asyncio.to_thread(self.rds_client.start_db_instance, DBInstanceIdentifier=db_instance_id)
+            self._describe_cache.invalidate(db_instance_id)
+            self._list_cache.clear()
             logger.info(f"Starting RDS instance: {db_instance_id}")
             return True, f"Đang khởi động RDS instance: {db_instance_id}"
         except Exception as e:
@@ -194,7 +346,9 @@ class RDSManager:
             if await self._is_read_replica(db_instance_id):
                 return False, f"Không thể start/stop read replica instance. Vui lòng thao tác trên primary instance."
 
-            response = self.rds_client.stop_db_instance(DBInstanceIdentifier=db_instance_id)
+            response = await asyncio.to_thread(self.rds_client.stop_db_instance, DBInstanceIdentifier=db_instance_id)
+            self._describe_cache.invalidate(db_instance_id)
+            self._list_cache.clear()
             logger.info(f"Stopping RDS instance: {db_instance_id}")
             return True, f"Đang tắt RDS instance: {db_instance_id}"
         except Exception as e:
@@ -212,8 +366,7 @@ class RDSManager:
             tuple: (success: bool, message: str)
         """
         try:
-            response = self.rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-            status = response['DBInstances'][0]['DBInstanceStatus']
+            status = (await self._describe(db_instance_id))['DBInstanceStatus']
             logger.info(f"RDS instance {db_instance_id} status: {status}")
             return True, f"Trạng thái của RDS instance {db_instance_id}: {status}"
         except Exception as e:
@@ -227,15 +380,21 @@ class RDSManager:
         Returns:
             tuple: (success: bool, instances: list)
         """
+        cached = self._list_cache.get(AWS_REGION)
+        if cached is not None:
+            return True, cached
+
         try:
             logger.info("Getting list of RDS instances...")
-            response = self.rds_client.describe_db_instances()
+            db_instances = await asyncio.to_thread(self._describe_all_db_instances)
             instances = []
             
-            logger.info(f"Found {len(response['DBInstances'])} instances")
-            for instance in response['DBInstances']:
+            logger.info(f"Found {len(db_instances)} instances")
+            for instance in db_instances:
                 instance_id = instance['DBInstanceIdentifier']
                 logger.info(f"Processing instance: {instance_id}")
+                # The list already holds full describe results; reuse them for per-instance lookups
+                self._describe_cache.set(instance_id, instance)
                 instance_info = {
                     'identifier': instance_id,
                     'status': instance['DBInstanceStatus'],
@@ -247,89 +406,66 @@ class RDSManager:
                 instances.append(instance_info)
                 logger.info(f"Instance info: {instance_info}")
             
+            self._list_cache.set(AWS_REGION, instances)
             return True, instances
         except Exception as e:
             logger.error(f"Error listing RDS instances: {str(e)}")
             return False, f"Lỗi khi lấy danh sách RDS: {str(e)}"
 
-    async def get_instance_metrics(self, db_instance_id: str):
+    async def get_instance_metrics(self, db_instance_id: str, instance_class: str = None):
         """
         Get metrics for an RDS instance.
         Includes: CPU, Memory, Storage, IOPS, and Connections.
         
         Args:
             db_instance_id (str): RDS instance identifier
+            instance_class (str): DB instance class, if the caller already knows it (e.g. from list_all_instances)
             
         Returns:
             tuple: (success: bool, metrics: dict)
         """
         try:
-            end_time = datetime.datetime.utcnow()
-            start_time = end_time - datetime.timedelta(hours=1)
-
-            # Get instance info and memory
-            rds_info = self.rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-            instance_class = rds_info['DBInstances'][0]['DBInstanceClass']
-            total_memory_gb = await self.instance_info.get_instance_memory(instance_class)
-            total_memory = (total_memory_gb or 0) * 1024 * 1024 * 1024  # Convert GB to bytes
-
-            # Define metrics to collect
-            metrics = {
-                'CPU': {
-                    'MetricName': 'CPUUtilization',
-                    'Unit': 'Percent'
-                },
-                'Memory': {
-                    'MetricName': 'FreeableMemory',
-                    'Unit': 'Bytes'
-                },
-                'Storage': {
-                    'MetricName': 'FreeStorageSpace',
-                    'Unit': 'Bytes'
-                },
-                'IOPS': {
-                    'MetricName': 'ReadIOPS',
-                    'Unit': 'Count/Second'
-                },
-                'Connections': {
-                    'MetricName': 'DatabaseConnections',
-                    'Unit': 'Count'
-                }
-            }
+            now = time.time()
+            end_time = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc)
+            start_time = datetime.datetime.fromtimestamp(now - 3600, tz=datetime.timezone.utc)
 
-            # Collect and format metrics
-            results = {}
-            for metric_name, metric_info in metrics.items():
-                response = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/RDS',
-                    MetricName=metric_info['MetricName'],
-                    Dimensions=[{'Name': 'DBInstanceIdentifier', 'Value': db_instance_id}],
+            # Instance class comes from the caller or the shared describe cache
+            if instance_class is None:
+                instance_class = (await self._describe(db_instance_id))['DBInstanceClass']
+
+            # One GetMetricData request covers every metric; the memory lookup runs alongside it
+            queries = [
+                {
+                    'Id': f"m{i}",
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/RDS',
+                            'MetricName': metric_info['MetricName'],
+                            'Dimensions': [{'Name': 'DBInstanceIdentifier', 'Value': db_instance_id}]
+                        },
+                        'Period': 300,  # 5 minutes
+                        'Stat': 'Average'
+                    }
+                }
+                for i, metric_info in enumerate(_RDS_METRICS.values())
+            ]
+            total_memory_gb, response = await asyncio.gather(
+                self.instance_info.get_instance_memory(instance_class),
+                asyncio.to_thread(
+                    self.cloudwatch.get_metric_data,
+                    MetricDataQueries=queries,
                     StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,  # 5 minutes
-                    Statistics=['Average']
+                    EndTime=end_time
                 )
+            )
+            data = {result['Id']: result for result in response['MetricDataResults']}
 
-                if response['Datapoints']:
-                    latest = max(response['Datapoints'], key=lambda x: x['Timestamp'])
-                    value = latest['Average']
-                    
-                    # Format based on metric type
-                    if metric_info['Unit'] == 'Bytes':
-                        if metric_name == 'Memory':
-                            free_memory = value
-                            used_memory = total_memory - free_memory if total_memory > 0 else 0
-                            memory_usage_percent = (used_memory / total_memory * 100) if total_memory > 0 else 0
-                            free_memory_gb = free_memory / (1024 * 1024 * 1024)
-                            results[metric_name] = f"{free_memory_gb:.1f}/{total_memory_gb:.1f} GB ({memory_usage_percent:.1f}% used)"
-                        else:
-                            results[metric_name] = f"{value / (1024 * 1024 * 1024):.2f} GB"
-                    elif metric_info['Unit'] == 'Percent':
-                        results[metric_name] = f"{value:.1f}%"
-                    elif metric_info['Unit'] == 'Count/Second':
-                        results[metric_name] = f"{value:.1f}/s"
-                    else:
-                        results[metric_name] = f"{value:.1f}"
+            results = {}
+            for i, (metric_name, metric_info) in enumerate(_RDS_METRICS.items()):
+                result = data.get(f"m{i}", {})
+                if result.get('Values'):
+                    _, value = max(zip(result['Timestamps'], result['Values']), key=lambda x: x[0])
+                    results[metric_name] = metric_info['format'](value, total_memory_gb)
                 else:
                     results[metric_name] = 'N/A'
 
@@ -19,16 +19,56 @@ from ..aws.ec2 import EC2Manager
 from ..aws.rds import RDSManager
 from ..aws.eks import EKSManager
 from ..utils.logger import get_logger
-from .utils import add_success_reaction, add_error_reaction, create_embed, format_instance_info
+from .utils import add_success_reaction, add_error_reaction, create_embed, format_instance_info, send_paginated_fields
 from ..services.deepseek import DeepSeekService
 from ..services.openai_service import OpenAIService
 import random
 from datetime import datetime, timezone
 import os
-import json
+from ..utils.helpers import LazyJson
 
 logger = get_logger(__name__)
 
+# Static embed text shared by the EKS list commands
+_SCALABLE_DESCRIPTION = "Danh sách các nodegroup có thể scale"
+_SCALE_CMD_TMPL = "`!eks-scale {name} <số_lượng_node>`"
+
+def _parse_tags(tags):
+    """Parse space-separated key=value pairs; values may contain '='. Raises ValueError on a bad token."""
+    tag_dict = {}
+    for token in tags.split():
+        key, sep, value = token.partition('=')
+        if not sep or not key:
+            raise ValueError(token)
+        tag_dict[key] = value
+    return tag_dict
+
+class NodegroupButton(discord.ui.View):
+    # Confirmation is interactive; don't hold the view (and its timer) longer than needed
+    def __init__(self, action_type="create", timeout=60):
+        super().__init__(timeout=timeout)
+        self.value = None
+        self.action_type = action_type
+
+    def _finish(self, value):
+        """Record the answer and release the buttons so the view can be collected"""
+        self.value = value
+        self.clear_items()
+        self.stop()
+
+    @discord.ui.button(label='✅ Xác nhận', style=discord.ButtonStyle.green)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        self._finish(True)
+
+    @discord.ui.button(label='❌ Hủy', style=discord.ButtonStyle.red)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        self._finish(False)
+
+    async def on_timeout(self):
+        self._finish(False)
+
 class EC2Commands(commands.Cog):
     """Commands for managing EC2 instances"""
     
@@ -147,8 +187,12 @@ class EC2Commands(commands.Cog):
         }
 
     async def cog_load(self):
+        await self.ec2_manager.initialize()
         logger.info("EC2Commands cog loaded")
 
+    async def cog_unload(self):
+        await self.ec2_manager.close()
+
     async def wait_for_state(self, ctx, instance_id, target_state, server_name):
         """Chờ và cập nhật trạng thái cho đến khi instance đạt trạng thái mong muốn"""
         start_time = time.time()
@@ -442,8 +486,10 @@ class EC2Commands(commands.Cog):
                     return
                 
                 # Lấy thông tin chi tiết
-                response = self.ec2_manager.ec2_client.describe_instances(InstanceIds=[instance_id])
-                instance = response['Reservations'][0]['Instances'][0]
+                instance = await self.ec2_manager.describe_instance(instance_id)
+                if instance is None:
+                    await ctx.send(f"❌ Không tìm thấy instance: {server_name}")
+                    return
                 
                 # Lấy Name tag
                 instance_name = ''
@@ -1108,26 +1154,37 @@ class EC2Commands(commands.Cog):
                     color=discord.Color.blue()
                 )
 
-                for friendly_name, instance_id in RDS_INSTANCES.items():
-                    success, metrics = await self.rds_manager.get_instance_metrics(instance_id)
-                    if success:
-                        # Add status
-                        status_success, status = await self.rds_manager.get_instance_status(instance_id)
-                        if status_success:
-                            status_emoji = "🟢" if status == 'available' else "🔴" if status == 'stopped' else "🟡"
-                            metrics_text = (
-                                f"{status_emoji} Status: {status}\n"
-                                f"CPU Usage: {metrics.get('CPU', 'N/A')}\n"
-                                f"Memory Free: {metrics.get('Memory', 'N/A')}\n"
-                                f"Storage Free: {metrics.get('Storage', 'N/A')}\n"
-                                f"IOPS: {metrics.get('IOPS', 'N/A')}\n"
-                                f"Connections: {metrics.get('Connections', 'N/A')}"
-                            )
-                            main_embed.add_field(
-                                name=f"📊 {friendly_name}",
-                                value=f"```yaml\n{metrics_text}\n```",
-                                inline=False
-                            )
+                # One (cached) list call gives every instance class, so metrics don't describe each instance
+                list_success, instances = await self.rds_manager.list_all_instances()
+                instance_classes = {i['identifier']: i['size'] for i in instances} if list_success else {}
+
+                # Fetch every instance concurrently so the RDS describe batcher can merge the status lookups
+                results = await asyncio.gather(*(
+                    asyncio.gather(
+                        self.rds_manager.get_instance_metrics(
+                            instance_id, instance_class=instance_classes.get(instance_id)
+                        ),
+                        self.rds_manager.get_instance_status(instance_id)
+                    )
+                    for instance_id in RDS_INSTANCES.values()
+                ))
+
+                for friendly_name, ((success, metrics), (status_success, status)) in zip(RDS_INSTANCES, results):
+                    if success and status_success:
+                        status_emoji = "🟢" if status == 'available' else "🔴" if status == 'stopped' else "🟡"
+                        metrics_text = (
+                            f"{status_emoji} Status: {status}\n"
+                            f"CPU Usage: {metrics.get('CPU', 'N/A')}\n"
+                            f"Memory Free: {metrics.get('Memory', 'N/A')}\n"
+                            f"Storage Free: {metrics.get('Storage', 'N/A')}\n"
+                            f"IOPS: {metrics.get('IOPS', 'N/A')}\n"
+                            f"Connections: {metrics.get('Connections', 'N/A')}"
+                        )
+                        main_embed.add_field(
+                            name=f"📊 {friendly_name}",
+                            value=f"```yaml\n{metrics_text}\n```",
+                            inline=False
+                        )
 
                 current_time = datetime.now().strftime("%H:%M:%S")
                 main_embed.set_footer(text=f"System Time: {current_time} | Timezone: {self.ec2_manager.timezone}")
@@ -1397,7 +1454,7 @@ class EKSCommands(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.eks_manager = EKSManager()
+        self.eks_manager = getattr(bot, 'eks', None) or EKSManager()
         self.notification_minutes = int(os.getenv('EKS_PERF_NOTIFICATION_MINUTES', '5'))
         # Maximum running time in hours before sending warning
         self.max_running_hours = float(os.getenv('EKS_PERF_MAX_HOURS', '4'))
@@ -1473,13 +1530,11 @@ class EKSCommands(commands.Cog):
         """Monitor performance nodegroups and send notifications if they run too long"""
         try:
             # Get all nodegroups
-            nodegroups = self.eks_manager.eks_client.list_nodegroups(
-                clusterName=self.eks_manager.cluster_name
-            )['nodegroups']
+            nodegroups = await self.eks_manager.get_nodegroup_names()
             
             for nodegroup in nodegroups:
-                if self.eks_manager.is_performance_nodegroup(nodegroup):
-                    running_time = self.eks_manager.get_nodegroup_running_time(nodegroup)
+                if await self.eks_manager.is_performance_nodegroup(nodegroup):
+                    running_time = await self.eks_manager.get_nodegroup_running_time(nodegroup)
                     
                     if running_time and running_time >= self.max_running_hours and nodegroup not in self.notified_nodegroups:
                         # Send notification to all channels the bot is in
@@ -1514,6 +1569,417 @@ class EKSCommands(commands.Cog):
         """Clean up when cog is unloaded"""
         self.monitor_performance_nodes.cancel()
 
+    @commands.command(name='eks-list')
+    async def list_nodes(self, ctx):
+        """List all nodegroups and their tags"""
+        eks_manager = self.eks_manager
+        success, nodegroups = await eks_manager.list_nodegroups()
+        
+        if success:
+            fields = [
+                (
+                    f"📦 {ng['name']}",
+                    "\n".join(filter(None, [
+                        f"Status: {ng['status']}",
+                        f"Size: {ng['size']} nodes (min: {ng['min_size']}, max: {ng['max_size']})",
+                        "**Tags:**" if ng['tags'] else None,
+                        *(f"• {key}: {value}" for key, value in ng['tags'].items())
+                    ]))
+                )
+                for ng in nodegroups
+            ]
+            
+            await send_paginated_fields(
+                ctx,
+                title="EKS Nodegroups Status",
+                description=f"🔷 Cluster: **{eks_manager.cluster_name}**",
+                color=discord.Color.blue(),
+                fields=fields
+            )
+        else:
+            await ctx.send(f"❌ Error listing nodegroups: {nodegroups}")
+
+    @commands.command(name='eks-tag')
+    async def add_tags(self, ctx, nodegroup: str = None, *, tags: str = None):
+        """Add tags to a nodegroup. Format: !eks-tag nodegroup-name key1=value1 key2=value2"""
+        if nodegroup is None:
+            await ctx.send("❌ Thiếu tên nodegroup. Sử dụng: `!eks-tag <tên_nodegroup> <key1=value1> [key2=value2 ...]`")
+            return
+        if tags is None:
+            await ctx.send("❌ Thiếu tags. Sử dụng: `!eks-tag <tên_nodegroup> <key1=value1> [key2=value2 ...]`")
+            return
+
+        try:
+            # Parse tags from space-separated key=value pairs
+            tag_dict = _parse_tags(tags)
+            
+            eks_manager = self.eks_manager
+            success, result = await eks_manager.add_nodegroup_tags(nodegroup, tag_dict)
+            
+            if success:
+                embed = discord.Embed(
+                    title="✅ Tags Added Successfully",
+                    description=f"Added tags to nodegroup: {nodegroup} in cluster: {eks_manager.cluster_name}",
+                    color=discord.Color.green()
+                )
+                for key, value in tag_dict.items():
+                    embed.add_field(name=key, value=value)
+                await ctx.send(embed=embed)
+            else:
+                await ctx.send(f"❌ Error adding tags: {result}")
+        except ValueError as e:
+            await ctx.send(f"❌ Invalid tag format: `{e}`. Use: `!eks-tag nodegroup-name key1=value1 key2=value2`")
+
+    @commands.command(name='eks-untag')
+    async def remove_tags(self, ctx, nodegroup: str = None, *, tags: str = None):
+        """Remove tags from a nodegroup. Format: !eks-untag nodegroup-name tag1 tag2"""
+        if nodegroup is None:
+            await ctx.send("❌ Thiếu tên nodegroup. Sử dụng: `!eks-untag <tên_nodegroup> <key1> [key2 ...]`")
+            return
+        if tags is None:
+            await ctx.send("❌ Thiếu tags. Sử dụng: `!eks-untag <tên_nodegroup> <key1> [key2 ...]`")
+            return
+
+        tag_keys = tags.split()
+        eks_manager = self.eks_manager
+        success, result = await eks_manager.remove_nodegroup_tags(nodegroup, tag_keys)
+        
+        if success:
+            embed = discord.Embed(
+                title="✅ Tags Removed Successfully",
+                description=f"Removed tags from nodegroup: {nodegroup} in cluster: {eks_manager.cluster_name}\nRemoved tags: {', '.join(tag_keys)}",
+                color=discord.Color.green()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send(f"❌ Error removing tags: {result}")
+
+    @commands.command(name='eks-scale')
+    async def scale(self, ctx, nodegroup: str = None, size: int = None):
+        """Scale a nodegroup to the specified size. Format: !eks-scale nodegroup-name desired_size"""
+        if nodegroup is None:
+            await ctx.send("❌ Thiếu tên nodegroup. Sử dụng: `!eks-scale <tên_nodegroup> <số_lượng_node>`")
+            return
+        if size is None:
+            await ctx.send("❌ Thiếu số lượng node. Sử dụng: `!eks-scale <tên_nodegroup> <số_lượng_node>`")
+            return
+
+        eks_manager = self.eks_manager
+        success, result = await eks_manager.scale_nodegroup(nodegroup, size)
+        
+        if success:
+            embed = discord.Embed(
+                title="✅ Scaling Nodegroup",
+                description=f"Scaled nodegroup: {nodegroup} in cluster: {eks_manager.cluster_name}",
+                color=discord.Color.green()
+            )
+            embed.add_field(name="Previous Size", value=str(result['previous_size']))
+            embed.add_field(name="New Size", value=str(result['new_size']))
+            embed.add_field(name="Allowed Range", value=f"{result['min_size']}-{result['max_size']}")
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send(f"❌ Error scaling nodegroup: {result}")
+
+    @commands.command(name='eks-status')
+    async def nodegroup_status(self, ctx, nodegroup: str = None):
+        """Get detailed status of a nodegroup. Format: !eks-status nodegroup-name"""
+        if nodegroup is None:
+            await ctx.send("❌ Thiếu tên nodegroup. Sử dụng: `!eks-status <tên_nodegroup>`")
+            return
+
+        eks_manager = self.eks_manager
+        success, result = await eks_manager.get_nodegroup_details(nodegroup)
+        
+        if success:
+            embed = discord.Embed(
+                title=f"Nodegroup Status: {result['nodegroup_name']} in cluster: {eks_manager.cluster_name}",
+                description=f"Cluster: {result['cluster_name']}",
+                color=discord.Color.blue()
+            )
+            embed.add_field(name="Status", value=result['status'])
+            embed.add_field(name="Current Size", value=str(result['current_size']))
+            embed.add_field(name="Size Range", value=f"{result['min_size']}-{result['max_size']}")
+            
+            if result['tags']:
+                tags_text = "\n".join(f"• {k}: {v}" for k, v in result['tags'].items())
+                embed.add_field(name="Tags", value=tags_text, inline=False)
+                
+            if result['health']:
+                health_text = "\n".join(f"• {k}: {v}" for k, v in result['health'].items())
+                embed.add_field(name="Health", value=health_text, inline=False)
+                
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send(f"❌ Error getting status: {result}")
+
+    @commands.command(name='eks-scalable')
+    async def list_scalable(self, ctx):
+        """List all nodegroups that can be scaled with their current sizes and limits"""
+        eks_manager = self.eks_manager
+        success, nodegroups = await eks_manager.list_scalable_nodegroups()
+        
+        if success:
+            fields = [
+                (
+                    f"📦 {ng['name']}",
+                    "\n".join([
+                        f"🔹 Current Size: **{ng['current_size']}** nodes",
+                        f"🔸 Size Range: **{ng['min_size']}-{ng['max_size']}** nodes",
+                        f"💻 Instance Types: {', '.join(ng['instance_types'])}",
+                        f"📊 Status: {ng['status']}",
+                        "",
+                        "Scale command:",
+                        _SCALE_CMD_TMPL.format(name=ng['name'])
+                    ])
+                )
+                for ng in nodegroups
+            ]
+            
+            await send_paginated_fields(
+                ctx,
+                title="🔄 Scalable EKS Nodegroups in cluster: " + eks_manager.cluster_name,
+                description=_SCALABLE_DESCRIPTION,
+                color=discord.Color.blue(),
+                fields=fields
+            )
+        else:
+            await ctx.send(f"❌ Error listing scalable nodegroups: {nodegroups}")
+
+    @commands.command(name='eks-create')
+    async def create_nodegroup(self, ctx, nodegroup: str = None, instance_type: str = None, desired_size: int = None, 
+                             min_size: int = None, max_size: int = None, capacity_type: str = 'ON_DEMAND', *, tags: str = None):
+        """Create a new nodegroup with specified configuration and tags"""
+        if nodegroup is None or instance_type is None or desired_size is None or min_size is None or max_size is None:
+            example = (
+                "❌ Thiếu thông tin. Sử dụng format:\n"
+                "`!eks-create <tên_nodegroup> <instance_type> <desired_size> <min_size> <max_size> [ON_DEMAND|SPOT] [key1=value1 key2=value2 ...]`\n\n"
+                "Ví dụ:\n"
+                "`!eks-create prod-nodes t3.medium 3 2 5 ON_DEMAND environment=prod team=backend` (On-Demand Instances)\n"
+                "`!eks-create spot-nodes t3.small 2 1 3 SPOT team=dev` (Spot Instances)\n"
+                "`!eks-create basic-nodes t3.small 2 1 3` (Mặc định: On-Demand)"
+            )
+            await ctx.send(example)
+            return
+
+        # Validate capacity type
+        capacity_type = capacity_type.upper()
+        if capacity_type not in ['ON_DEMAND', 'SPOT']:
+            await ctx.send("❌ Capacity type phải là 'ON_DEMAND' hoặc 'SPOT'")
+            return
+
+        # Parse tags if provided
+        tag_dict = {}
+        if tags:
+            try:
+                tag_dict = _parse_tags(tags)
+            except ValueError as e:
+                await ctx.send(f"❌ Invalid tag format: `{e}`. Use: `key1=value1 key2=value2`")
+                return
+
+        eks_manager = self.eks_manager
+
+        # Reply right away so slow AWS calls don't leave the command hanging
+        msg = await ctx.send("⏳ Đang lấy thông tin...")
+        view = NodegroupButton(action_type="create")
+        
+        # Get cost estimate
+        started = time.perf_counter()
+        success, cost_info = await eks_manager.estimate_nodegroup_cost(instance_type, desired_size, capacity_type)
+        logger.info(f"⏱️ eks-create: estimate={(time.perf_counter() - started) * 1000:.0f}ms")
+        if not success:
+            await msg.edit(content=f"❌ Error estimating cost: {cost_info}")
+            return
+            
+        # Create confirmation message with cost estimate
+        embed = discord.Embed(
+            title="💰 Nodegroup Cost Estimate",
+            description=(
+                f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                f"📦 Nodegroup: **{nodegroup}**\n"
+                f"💻 Instance Type: {instance_type}\n"
+                f"🔢 Size: {desired_size} nodes ({min_size}-{max_size})\n"
+                f"💰 Capacity Type: **{capacity_type}**\n\n"
+                f"💵 Chi phí ước tính:\n"
+                f"• Mỗi node/giờ: ${cost_info['hourly_per_node']}\n"
+                f"• Tổng/tháng: **${cost_info['monthly_total']}**\n\n"
+                "⚠️ Bạn có chắc chắn muốn tạo nodegroup này?"
+            ),
+            color=discord.Color.blue()
+        )
+        
+        # Add confirmation buttons
+        await msg.edit(content=None, embed=embed, view=view)
+        
+        # Wait for button press
+        await view.wait()
+        
+        if view.value is None:
+            await msg.edit(content="❌ Hết thời gian xác nhận. Vui lòng thử lại.", view=None)
+            return
+        elif not view.value:
+            await msg.edit(content="❌ Đã hủy tạo nodegroup.", view=None)
+            return
+            
+        # User confirmed, proceed with creation
+        await msg.edit(
+            embed=discord.Embed(
+                title="🔄 Creating Nodegroup",
+                description=(
+                    f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                    f"📦 Nodegroup: **{nodegroup}**\n"
+                    f"💻 Instance Type: {instance_type}\n"
+                    f"🔢 Size: {desired_size} nodes ({min_size}-{max_size})\n"
+                    f"💰 Capacity Type: **{capacity_type}**\n"
+                    "⌛ Đang tạo nodegroup... (có thể mất 10-15 phút)"
+                ),
+                color=discord.Color.gold()
+            ),
+            view=None
+        )
+        
+        success, result = await eks_manager.create_nodegroup(
+            nodegroup, instance_type, desired_size, 
+            min_size, max_size, tag_dict, capacity_type
+        )
+        
+        if success:
+            # Wait for nodegroup creation
+            success, status = await eks_manager.wait_for_nodegroup_status(nodegroup, 'ACTIVE')
+            if success:
+                await msg.edit(
+                    embed=discord.Embed(
+                        title="✅ Nodegroup Created Successfully",
+                        description=(
+                            f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                            f"📦 Nodegroup: **{nodegroup}**\n"
+                            f"💻 Instance Type: {instance_type}\n"
+                            f"🔢 Size: {desired_size} nodes ({min_size}-{max_size})\n"
+                            f"💰 Capacity Type: **{capacity_type}**\n"
+                            f"💵 Chi phí ước tính/tháng: **${cost_info['monthly_total']}**\n\n"
+                            "✨ Nodegroup đã được tạo thành công!"
+                        ),
+                        color=discord.Color.green()
+                    )
+                )
+            else:
+                await msg.edit(
+                    embed=discord.Embed(
+                        title="❌ Creation Failed",
+                        description=(
+                            f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                            f"📦 Nodegroup: **{nodegroup}**\n"
+                            f"💰 Capacity Type: **{capacity_type}**\n"
+                            f"❌ Error: {status}"
+                        ),
+                        color=discord.Color.red()
+                    )
+                )
+        else:
+            await msg.edit(
+                embed=discord.Embed(
+                    title="❌ Creation Failed",
+                    description=(
+                        f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                        f"📦 Nodegroup: **{nodegroup}**\n"
+                        f"💰 Capacity Type: **{capacity_type}**\n"
+                        f"❌ Error: {result}"
+                    ),
+                    color=discord.Color.red()
+                )
+            )
+
+    @commands.command(name='eks-delete')
+    async def delete_nodegroup(self, ctx, nodegroup: str = None):
+        """Delete a nodegroup"""
+        if nodegroup is None:
+            await ctx.send("❌ Thiếu tên nodegroup. Sử dụng: `!eks-delete <tên_nodegroup>`")
+            return
+
+        eks_manager = self.eks_manager
+
+        # Reply right away so slow AWS calls don't leave the command hanging
+        msg = await ctx.send("⏳ Đang lấy thông tin...")
+        view = NodegroupButton(action_type="delete")
+        
+        # Get nodegroup info for confirmation
+        started = time.perf_counter()
+        try:
+            ng_info = await eks_manager.describe_nodegroup(nodegroup)
+        except Exception as e:
+            await msg.edit(content=f"❌ Error getting nodegroup info: {str(e)}")
+            return
+        finally:
+            logger.info(f"⏱️ eks-delete: describe={(time.perf_counter() - started) * 1000:.0f}ms")
+            
+        # Create confirmation message
+        embed = discord.Embed(
+            title="⚠️ Delete Nodegroup Confirmation",
+            description=(
+                f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                f"📦 Nodegroup: **{nodegroup}**\n"
+                f"💻 Instance Type: {ng_info['instanceTypes'][0]}\n"
+                f"🔢 Current Size: {ng_info['scalingConfig']['desiredSize']} nodes\n"
+                f"💰 Capacity Type: **{ng_info['capacityType']}**\n\n"
+                "⚠️ **CẢNH BÁO**: Hành động này không thể hoàn tác!\n"
+                "Bạn có chắc chắn muốn xóa nodegroup này?"
+            ),
+            color=discord.Color.red()
+        )
+        
+        # Add confirmation buttons
+        await msg.edit(content=None, embed=embed, view=view)
+        
+        # Wait for button press
+        await view.wait()
+        
+        if view.value is None:
+            await msg.edit(content="❌ Hết thời gian xác nhận. Vui lòng thử lại.", view=None)
+            return
+        elif not view.value:
+            await msg.edit(content="❌ Đã hủy xóa nodegroup.", view=None)
+            return
+            
+        # User confirmed, proceed with deletion
+        await msg.edit(
+            embed=discord.Embed(
+                title="🔄 Deleting Nodegroup",
+                description=(
+                    f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                    f"📦 Nodegroup: **{nodegroup}**\n"
+                    "⌛ Đang xóa nodegroup... (có thể mất 5-10 phút)"
+                ),
+                color=discord.Color.gold()
+            ),
+            view=None
+        )
+        
+        success, result = await eks_manager.delete_nodegroup(nodegroup)
+        
+        if success:
+            await msg.edit(
+                embed=discord.Embed(
+                    title="✅ Nodegroup Deleted Successfully",
+                    description=(
+                        f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                        f"📦 Nodegroup: **{nodegroup}**\n"
+                        "✨ Nodegroup đã được xóa thành công!"
+                    ),
+                    color=discord.Color.green()
+                )
+            )
+        else:
+            await msg.edit(
+                embed=discord.Embed(
+                    title="❌ Deletion Failed",
+                    description=(
+                        f"🔷 Cluster: **{eks_manager.cluster_name}**\n"
+                        f"📦 Nodegroup: **{nodegroup}**\n"
+                        f"❌ Error: {result}"
+                    ),
+                    color=discord.Color.red()
+                )
+            )
+
     @commands.group(name='eks')
     async def eks(self, ctx):
         """Quản lý EKS clusters"""
@@ -1694,15 +2160,15 @@ class EKSCommands(commands.Cog):
     @eks.command(name='delete-performance')
     async def delete_performance(self, ctx):
         """Xóa performance nodegroup"""
-        logger.info(f"[DELETE] ====== Delete Performance Command Started ======")
-        logger.info(f"[DELETE] User: {ctx.author}")
-        logger.info(f"[DELETE] Channel: {ctx.channel}")
-        logger.info(f"[DELETE] Guild: {ctx.guild}")
+        logger.info("[DELETE] ====== Delete Performance Command Started ======")
+        logger.info("[DELETE] User: %s", ctx.author)
+        logger.info("[DELETE] Channel: %s", ctx.channel)
+        logger.info("[DELETE] Guild: %s", ctx.guild)
         
         try:
             # Get nodegroup name from config or use default
             nodegroup_name = os.getenv('EKS_PERF_NODEGROUP_NAME', 'perf-dev')
-            logger.info(f"[DELETE] Target nodegroup: {nodegroup_name}")
+            logger.info("[DELETE] Target nodegroup: %s", nodegroup_name)
             
             # Create confirmation buttons
             view = discord.ui.View()
@@ -1714,7 +2180,7 @@ class EKSCommands(commands.Cog):
                     await interaction.response.send_message("Bạn không có quyền sử dụng nút này!", ephemeral=True)
                     return
 
-                logger.info(f"[DELETE] User {interaction.user} confirmed deletion")
+                logger.info("[DELETE] User %s confirmed deletion", interaction.user)
                 # Disable all buttons
                 for item in view.children:
                     item.disabled = True
@@ -1725,10 +2191,10 @@ class EKSCommands(commands.Cog):
                 # Check if nodegroup exists first
                 logger.info("[DELETE] Checking nodegroup status...")
                 status = await self.eks_manager.get_nodegroup_status(nodegroup_name)
-                logger.info(f"[DELETE] Initial nodegroup status: {status}")
+                logger.info("[DELETE] Initial nodegroup status: %s", status)
                 
                 if status is None:
-                    logger.warning(f"[DELETE] Nodegroup '{nodegroup_name}' not found")
+                    logger.warning("[DELETE] Nodegroup '%s' not found", nodegroup_name)
                     await ctx.send(f"❌ Không tìm thấy nodegroup '{nodegroup_name}'")
                     return
             
@@ -1737,7 +2203,7 @@ class EKSCommands(commands.Cog):
                     logger.info("[DELETE] Getting nodegroup info for summary...")
                     nodegroup_info = await self.eks_manager.get_nodegroup_info(nodegroup_name)
                     if nodegroup_info:
-                        logger.info(f"[DELETE] Nodegroup info: {json.dumps(nodegroup_info, default=str)}")
+                        logger.debug("[DELETE] Nodegroup info: %s", LazyJson(nodegroup_info))
                         summary = (
                             f"ℹ️ Thông tin nodegroup sẽ xóa:\n"
                             f"• Tên: `{nodegroup_name}`\n"
@@ -1748,39 +2214,38 @@ class EKSCommands(commands.Cog):
                         )
                         await ctx.send(summary)
                 except Exception as e:
-                    logger.error(f"[DELETE] Error getting nodegroup info: {str(e)}")
+                    logger.error("[DELETE] Error getting nodegroup info: %s", e)
             
                 # Start deletion process
                 status_msg = await ctx.send(f"⏳ Bắt đầu xóa nodegroup '{nodegroup_name}'...")
                 success, message = await self.eks_manager.delete_performance_nodegroup(nodegroup_name)
                 
                 if not success:
-                    logger.error(f"[DELETE] Failed to initiate deletion: {message}")
+                    logger.error("[DELETE] Failed to initiate deletion: %s", message)
                     await status_msg.edit(content=message)
                     return
                 
                 # Monitor deletion progress with timeout
-                start_time = time.time()
+                start_time = time.monotonic()
                 max_wait_time = 20 * 60  # 20 minutes timeout
                 last_status = None
                 check_interval = 10  # Check every 10 seconds
                 
-                logger.info(f"[DELETE] Starting deletion monitoring loop...")
+                logger.info("[DELETE] Starting deletion monitoring loop...")
                 while True:
-                    current_time = time.time()
-                    if current_time - start_time > max_wait_time:
+                    if time.monotonic() - start_time > max_wait_time:
                         error_msg = f"❌ Quá thời gian chờ xóa nodegroup (20 phút)"
-                        logger.error(f"[DELETE] Timeout reached")
+                        logger.error("[DELETE] Timeout reached")
                         await status_msg.edit(content=error_msg)
                         return
                     
                     # Get current status
                     current_status = await self.eks_manager.get_nodegroup_status(nodegroup_name)
-                    logger.info(f"[DELETE] Current status: {current_status}")
+                    logger.info("[DELETE] Current status: %s", current_status)
                     
                     # Status changed
                     if current_status != last_status:
-                        logger.info(f"[DELETE] Status changed: {last_status} -> {current_status}")
+                        logger.info("[DELETE] Status changed: %s -> %s", last_status, current_status)
                         last_status = current_status
                         # Update Discord message with new status
                         status_text = status_messages.get(current_status, f"⚠️ {current_status}")
@@ -1794,18 +2259,18 @@ class EKSCommands(commands.Cog):
                     
                     elif current_status == 'DELETE_FAILED':
                         error_msg = f"❌ Xóa nodegroup '{nodegroup_name}' thất bại"
-                        logger.error(f"[DELETE] Deletion failed")
+                        logger.error("[DELETE] Deletion failed")
                         await status_msg.edit(content=error_msg)
                         return
                     
                     elif current_status == 'DEGRADED':
                         error_msg = f"⚠️ Nodegroup '{nodegroup_name}' trong trạng thái không ổn định"
-                        logger.warning(f"[DELETE] Nodegroup in degraded state")
+                        logger.warning("[DELETE] Nodegroup in degraded state")
                         await status_msg.edit(content=error_msg)
                         return
                     
                     # Sleep before next check
-                    logger.info(f"[DELETE] Waiting {check_interval} seconds before next status check...")
+                    logger.info("[DELETE] Waiting %s seconds before next status check...", check_interval)
                     await asyncio.sleep(check_interval)
 
             async def cancel_callback(cancel_interaction):
@@ -1834,8 +2299,8 @@ class EKSCommands(commands.Cog):
             logger.info("[DELETE] Sent deletion confirmation dialog")
 
         except Exception as e:
-            logger.error(f"[DELETE] Unexpected error in delete_performance command:")
-            logger.error(f"[DELETE] {str(e)}")
+            logger.error("[DELETE] Unexpected error in delete_performance command:")
+            logger.error("[DELETE] %s", e)
             logger.error("[DELETE] Stack trace:", exc_info=True)
             await ctx.send(f"❌ Lỗi không mong muốn: {str(e)}")
             await add_error_reaction(ctx.message)
@@ -36,6 +36,30 @@ def create_embed(title, description=None, color=discord.Color.blue()):
     )
     return embed
 
+# Discord embed limits (we stay a little under the hard caps)
+EMBED_MAX_FIELDS = 24
+EMBED_MAX_CHARS = 5500
+FIELD_VALUE_MAX_CHARS = 1024
+
+async def send_paginated_fields(ctx, title, description, color, fields):
+    """Send (name, value) fields as one or more embeds so Discord's size limits are never hit"""
+    def new_embed():
+        embed = discord.Embed(title=title, description=description, color=color)
+        return embed, embed.add_field, len(title or '') + len(description or '')
+
+    embed, add_field, total_len = new_embed()
+    for name, value in fields:
+        if len(value) > FIELD_VALUE_MAX_CHARS:
+            value = value[:FIELD_VALUE_MAX_CHARS - 1] + "…"
+        field_len = len(name) + len(value)
+        if embed.fields and (len(embed.fields) >= EMBED_MAX_FIELDS or total_len + field_len > EMBED_MAX_CHARS):
+            await ctx.send(embed=embed)
+            embed, add_field, total_len = new_embed()
+        add_field(name=name, value=value, inline=False)
+        total_len += field_len
+
+    await ctx.send(embed=embed)
+
 def format_instance_info(instance_details):
     """Format instance details for Discord embed"""
     if not instance_details:
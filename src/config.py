@@ -23,6 +23,12 @@ EKS_CLUSTER_NAME = os.getenv('EKS_CLUSTER_NAME', 'snowee-staging')
 # EC2 Configuration
 EC2_FULL_CONTROL = os.getenv('EC2_FULL_CONTROL_INSTANCES', '')
 EC2_METRICS_ONLY = os.getenv('EC2_METRICS_ONLY_INSTANCES', '')
+# Window for coalescing concurrent DescribeInstances lookups into one request
+EC2_DESCRIBE_BATCH_WINDOW_MS = int(os.getenv('EC2_DESCRIBE_BATCH_WINDOW_MS', '300'))
+# Window for coalescing concurrent DescribeDBInstances lookups into one request
+RDS_DESCRIBE_BATCH_WINDOW_MS = int(os.getenv('RDS_DESCRIBE_BATCH_WINDOW_MS', '300'))
+# On-disk cache of RDS instance class -> memory lookups, kept across restarts
+RDS_MEMORY_CACHE_FILE = os.getenv('RDS_MEMORY_CACHE_FILE', '/tmp/rds_memory_cache.json')
 
 EC2_INSTANCES = {}
 EC2_CONTROL_LEVELS = {}
@@ -62,6 +68,10 @@ for instance in RDS_METRICS_ONLY.split(','):
         RDS_INSTANCES[friendly_name] = instance_id
         RDS_CONTROL_LEVELS[friendly_name] = 2
 
+# Worker threads used to run blocking boto3 calls off the event loop; they mostly wait on network I/O,
+# so size well above the CPU count
+AWS_THREAD_POOL_SIZE = int(os.getenv('AWS_THREAD_POOL_SIZE', str(max(32, (os.cpu_count() or 4) * 5))))
+
 # Instance State Check Configuration
 STATE_CHECK_INTERVAL = int(os.getenv('STATE_CHECK_INTERVAL', '10'))  # seconds
 STATE_CHECK_TIMEOUT = int(os.getenv('STATE_CHECK_TIMEOUT', '300'))  # seconds
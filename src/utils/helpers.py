@@ -0,0 +1,158 @@
+import asyncio
+import json
+import time
+
+# orjson is optional; it encodes the large AWS payloads we log several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj, default=str):
+    """
+    Serialize obj to a JSON string, using orjson when it is installed.
+
+    Args:
+        obj: Object to serialize.
+        default: Fallback for objects JSON can't encode (datetime etc.), str by default.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default)
+
+
+def json_loads(data):
+    """Parse a JSON str or bytes payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class LazyJson:
+    """
+    Defer JSON serialization to log formatting time, so records a handler drops cost nothing.
+
+    Usage: logger.debug("Payload: %s", LazyJson(response))
+    """
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return json_dumps(self.obj)
+
+
+class TTLCache:
+    """
+    Small in-memory cache whose entries expire ttl seconds after they are set.
+
+    Args:
+        ttl (float): Lifetime of an entry in seconds.
+        maxsize (int): Maximum number of entries; the oldest entry is evicted first.
+    """
+
+    def __init__(self, ttl, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if it is missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key, value):
+        """Store value under key for ttl seconds"""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key):
+        """Drop key from the cache if present"""
+        self._data.pop(key, None)
+
+    def clear(self):
+        """Drop every entry"""
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RequestBatcher:
+    """
+    Coalesce single-key lookups that arrive within a short window into one bulk request.
+
+    Args:
+        fetch_many: async callable taking a list of keys and returning a dict key -> value.
+            Keys missing from the result resolve to None.
+        window (float): Seconds to wait for more callers before flushing.
+        max_batch (int): Flush immediately once this many distinct keys are pending.
+    """
+
+    def __init__(self, fetch_many, window=0.3, max_batch=100):
+        self._fetch_many = fetch_many
+        self._window = window
+        self._max_batch = max_batch
+        self._pending = {}
+        self._timer = None
+        self._inflight = set()
+
+    async def get(self, key):
+        """Queue a lookup for key and wait for the batched result"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self._max_batch:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._spawn(self._flush())
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_after(self._window))
+
+        return await future
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return task
+
+    async def _flush_after(self, delay):
+        await asyncio.sleep(delay)
+        await self._flush()
+
+    async def _flush(self):
+        batch, self._pending = self._pending, {}
+        self._timer = None
+        if not batch:
+            return
+
+        try:
+            results = await self._fetch_many(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in batch.items():
+            value = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
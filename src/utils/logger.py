@@ -1,12 +1,22 @@
 import logging
+import contextvars
 import colorlog
 from ..config import LOG_LEVEL
 
+# Per-operation correlation ID, set at the start of long operations and stamped on every log record
+correlation_id = contextvars.ContextVar('correlation_id', default='-')
+
+class CorrelationIdFilter(logging.Filter):
+    """Attach the current correlation ID to each record as %(cid)s"""
+    def filter(self, record):
+        record.cid = correlation_id.get()
+        return True
+
 class CustomFormatter(colorlog.ColoredFormatter):
     """Custom color formatter with better formatting"""
     def __init__(self):
         super().__init__(
-            fmt='%(log_color)s%(asctime)s %(levelname)-8s %(name)s:%(lineno)d - %(message)s%(reset)s',
+            fmt='%(log_color)s%(asctime)s %(levelname)-8s %(cid)s %(name)s:%(lineno)d - %(message)s%(reset)s',
             datefmt='%Y-%m-%d %H:%M:%S',
             log_colors={
                 'DEBUG': 'cyan',
@@ -29,6 +39,7 @@ def get_logger(name):
         
         # Set custom formatter
         handler.setFormatter(CustomFormatter())
+        handler.addFilter(CorrelationIdFilter())
         
         # Add handler to logger
         logger.addHandler(handler)
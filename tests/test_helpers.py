@@ -0,0 +1,94 @@
+import asyncio
+import decimal
+import json
+import unittest
+from unittest.mock import patch
+from src.utils.helpers import LazyJson, RequestBatcher, TTLCache, json_dumps, json_loads
+
+class TestTTLCache(unittest.TestCase):
+    @patch('src.utils.helpers.time.monotonic')
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(ttl=5)
+        cache.set('i-1234', 'running')
+
+        mock_monotonic.return_value = 104.9
+        self.assertEqual(cache.get('i-1234'), 'running')
+
+        mock_monotonic.return_value = 105.0
+        self.assertIsNone(cache.get('i-1234'))
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_oldest_when_full(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_invalidate(self):
+        cache = TTLCache(ttl=60)
+        cache.set('a', False)
+        self.assertIs(cache.get('a'), False)
+        cache.invalidate('a')
+        self.assertIsNone(cache.get('a'))
+
+class TestRequestBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_gets_share_one_fetch(self):
+        calls = []
+
+        async def fetch_many(keys):
+            calls.append(sorted(keys))
+            return {key: key.upper() for key in keys if key != 'missing'}
+
+        batcher = RequestBatcher(fetch_many, window=0.01)
+        results = await asyncio.gather(
+            batcher.get('a'), batcher.get('b'), batcher.get('a'), batcher.get('missing')
+        )
+
+        self.assertEqual(results, ['A', 'B', 'A', None])
+        self.assertEqual(calls, [['a', 'b', 'missing']])
+
+    async def test_max_batch_flushes_early(self):
+        calls = []
+
+        async def fetch_many(keys):
+            calls.append(len(keys))
+            return {key: key for key in keys}
+
+        batcher = RequestBatcher(fetch_many, window=10, max_batch=2)
+        results = await asyncio.wait_for(asyncio.gather(batcher.get('a'), batcher.get('b')), timeout=1)
+
+        self.assertEqual(results, ['a', 'b'])
+        self.assertEqual(calls, [2])
+
+    async def test_fetch_error_reaches_every_caller(self):
+        async def fetch_many(keys):
+            raise RuntimeError('AWS Error')
+
+        batcher = RequestBatcher(fetch_many, window=0.01)
+        results = await asyncio.gather(batcher.get('a'), batcher.get('b'), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+class TestJsonDumps(unittest.TestCase):
+    def test_unknown_types_use_default(self):
+        payload = {'status': 'ACTIVE', 'price': decimal.Decimal('0.0416'), 'nodes': [1, 2]}
+        self.assertEqual(json.loads(json_dumps(payload)), {'status': 'ACTIVE', 'price': '0.0416', 'nodes': [1, 2]})
+
+    @patch('src.utils.helpers.orjson', None)
+    def test_falls_back_to_stdlib(self):
+        self.assertEqual(json_dumps({'a': 1}), '{"a": 1}')
+        self.assertEqual(json_loads(b'{"a": 1}'), {'a': 1})
+
+    def test_lazy_json_serializes_on_str(self):
+        with patch('src.utils.helpers.json_dumps', return_value='{}') as mock_dumps:
+            lazy = LazyJson({'a': 1})
+            mock_dumps.assert_not_called()
+            self.assertEqual(str(lazy), '{}')
+            mock_dumps.assert_called_once_with({'a': 1})
+
+if __name__ == '__main__':
+    unittest.main()